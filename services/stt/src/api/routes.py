@@ -2,17 +2,27 @@
 # Licensed under the FSL-1.1-NC.
 """FastAPI routes for STT API."""
 
+import asyncio
 import io
-import tempfile
+import json
+import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from math import gcd
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from loguru import logger
 
+from src.config import get_settings
+from src.services import transcript_cache
+from src.services.audio_fast import decode_i16_mono_resample, resample_taps
+from src.services.parallel_transcribe import transcribe_parallel
+from src.transcribers.base import TranscriptionResult
 from src.transcribers.factory import get_model_sizes
 
 # Audio processing imports
@@ -26,67 +36,223 @@ try:
 except ImportError:
     AudioSegment = None
 
+try:
+    from scipy.signal import resample_poly
+except ImportError:
+    resample_poly = None
+
 router = APIRouter(prefix="/v1", tags=["transcription"])
 
+# One model instance serves every request, and neither MLX nor a single-worker
+# CTranslate2 model may be driven from two threads at once: all model calls run on
+# this one thread, in arrival order (which also keeps them off the event loop)
+_model_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt-model")
 
-def load_audio(file_bytes: bytes, filename: str) -> tuple[np.ndarray, int]:
-    """Load audio from bytes, convert to 16kHz mono float32."""
-    # Try soundfile first (supports wav, flac, ogg)
-    if sf is not None:
-        try:
-            audio, sr = sf.read(io.BytesIO(file_bytes))
-            if len(audio.shape) > 1:
-                audio = audio.mean(axis=1)  # Convert to mono
 
-            # Resample to 16kHz if needed
-            if sr != 16000:
-                import scipy.signal
+async def _run_model(func, *args):
+    """Run a blocking model call on the model thread."""
+    return await asyncio.get_running_loop().run_in_executor(_model_executor, func, *args)
+
+
+def _resample_to_16k(audio: np.ndarray, sr: int) -> np.ndarray:
+    """Resample audio to 16kHz using polyphase filtering."""
+    if resample_poly is None:
+        raise RuntimeError("Resampling requires scipy. Install with: pip install scipy")
+
+    g = gcd(sr, 16000)
+    up, down = 16000 // g, sr // g
+    audio = resample_poly(audio, up, down, window=resample_taps(up, down))
+    return audio.astype(np.float32, copy=False)
+
+
+# ffmpeg decode: stdin -> 16kHz mono float32 little-endian on stdout
+_FFMPEG_DECODE_CMD = [
+    "ffmpeg", "-v", "quiet", "-i", "pipe:0",
+    "-f", "f32le", "-ac", "1", "-ar", "16000", "pipe:1",
+]  # fmt: skip
+
+
+def _sniff(header: bytes) -> str:
+    """Detect container format from the first 12 bytes of a file."""
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return "wav"
+    if header[:4] == b"fLaC":
+        return "flac"
+    if header[:4] == b"OggS":
+        return "ogg"
+    return "compressed"
+
+
+def _decode_with_ffmpeg(file_bytes: bytes) -> np.ndarray:
+    """Decode any ffmpeg-supported format straight to 16kHz mono float32 PCM."""
+    proc = subprocess.run(
+        _FFMPEG_DECODE_CMD,
+        input=file_bytes,
+        capture_output=True,
+        check=True,
+    )
+    return np.frombuffer(proc.stdout, dtype=np.float32)
+
 
-                audio = scipy.signal.resample(audio, int(len(audio) * 16000 / sr))
-                sr = 16000
+def load_soundfile(source) -> tuple[np.ndarray, int]:
+    """
+    Decode a libsndfile-supported file (path or file object) to 16kHz mono float32.
+
+    Mono files decode directly into the returned array; multichannel frames are
+    read block by block and downmixed into one preallocated mono buffer, so the
+    full multichannel signal is never materialized.
+    """
+    with sf.SoundFile(source) as f:
+        sr = f.samplerate
+
+        # 16-bit PCM that needs mixing or resampling: one fused pass from int16
+        if f.subtype == "PCM_16" and (sr != 16000 or f.channels > 1):
+            pcm = f.read(dtype="int16", always_2d=True).reshape(-1)
+            return decode_i16_mono_resample(pcm, f.channels, sr), 16000
+
+        if f.channels == 1:
+            # Mono: libsndfile decodes straight into the returned float32 array
+            audio = f.read(dtype="float32")
+        else:
+            audio = np.empty(f.frames, dtype=np.float32)
+            pos = 0
+            for block in f.blocks(blocksize=1 << 15, dtype="float32", always_2d=True):
+                n = len(block)
+                np.mean(block, axis=1, dtype=np.float32, out=audio[pos : pos + n])
+                pos += n
+            audio = audio[:pos]
+
+    # Resample to 16kHz if needed
+    if sr != 16000:
+        audio = _resample_to_16k(audio, sr)
+        sr = 16000
+
+    return audio, sr
 
-            return audio.astype(np.float32), sr
+
+def load_audio(file_bytes: bytes, filename: str) -> tuple[np.ndarray, int]:
+    """Load audio from bytes, convert to 16kHz mono float32."""
+    # Determine format from magic bytes and extension
+    fmt = _sniff(file_bytes[:12])
+    ext = Path(filename).suffix.lower().lstrip(".")
+
+    # libsndfile handles wav, flac and ogg natively
+    if sf is not None and fmt != "compressed":
+        try:
+            return load_soundfile(io.BytesIO(file_bytes))
         except Exception:
             pass
 
-    # Try pydub for mp3, m4a, webm, etc.
+    # mp3, m4a, webm, etc.: pipe through ffmpeg directly, bypassing pydub
+    try:
+        samples = _decode_with_ffmpeg(file_bytes)
+        if len(samples):
+            return samples, 16000
+    except (OSError, subprocess.CalledProcessError):
+        pass
+
+    # Try pydub as a last resort
     if AudioSegment is not None:
         try:
-            # Determine format from extension
-            ext = Path(filename).suffix.lower().lstrip(".")
             if ext in ("mp3", "m4a", "mp4", "webm", "ogg", "wav", "flac"):
                 audio_segment = AudioSegment.from_file(io.BytesIO(file_bytes), format=ext)
 
-                # Convert to 16kHz mono
-                audio_segment = audio_segment.set_frame_rate(16000).set_channels(1)
-
-                # Convert to numpy array
-                samples = np.array(audio_segment.get_array_of_samples(), dtype=np.float32)
-                samples /= 32768.0  # Normalize int16 to float32
+                # Zero-copy view over the int16 PCM; mono mix and resampling to 16kHz
+                # happen in one fused pass instead of pydub's audioop conversions
+                audio_segment = audio_segment.set_sample_width(2)
+                pcm = np.frombuffer(audio_segment.raw_data, dtype=np.int16)
+                samples = decode_i16_mono_resample(
+                    pcm, audio_segment.channels, audio_segment.frame_rate
+                )
 
                 return samples, 16000
         except Exception:
             pass
 
-    # Fallback: save to temp file and try soundfile
-    with tempfile.NamedTemporaryFile(suffix=Path(filename).suffix, delete=True) as tmp:
-        tmp.write(file_bytes)
-        tmp.flush()
+    raise ValueError(f"Could not load audio file: {filename}")
 
-        if sf is not None:
-            audio, sr = sf.read(tmp.name)
-            if len(audio.shape) > 1:
-                audio = audio.mean(axis=1)
 
-            if sr != 16000:
-                import scipy.signal
+async def _read_upload(file: UploadFile, max_bytes: int) -> bytearray:
+    """Read an upload in 1 MB chunks, rejecting it as soon as it exceeds max_bytes."""
+    buf = bytearray()
+    while chunk := await file.read(1 << 20):
+        buf.extend(chunk)
+        if len(buf) > max_bytes:
+            raise HTTPException(status_code=413, detail="File too large")
+    return buf
 
-                audio = scipy.signal.resample(audio, int(len(audio) * 16000 / sr))
-                sr = 16000
 
-            return audio.astype(np.float32), sr
+def _upload_size(file: UploadFile) -> int:
+    """Get the size of the spooled upload without reading it."""
+    if file.size is not None:
+        return file.size
+    pos = file.file.tell()
+    size = file.file.seek(0, io.SEEK_END)
+    file.file.seek(pos)
+    return size
+
+
+_SRT_ZERO = "00:00:00,000"
+_VTT_ZERO = "00:00:00.000"
+
+
+def _format_timestamp(seconds: float, ms_sep: str) -> str:
+    """Format seconds as HH:MM:SS<sep>mmm (',' for SRT, '.' for WebVTT)."""
+    whole = int(seconds)
+    h, rem = divmod(whole, 3600)
+    m, s = divmod(rem, 60)
+    ms = int((seconds - whole) * 1000)
+    return f"{h:02d}:{m:02d}:{s:02d}{ms_sep}{ms:03d}"
 
-    raise ValueError(f"Could not load audio file: {filename}")
+
+async def _stream_transcription(
+    transcriber, audio: np.ndarray, sample_rate: int, lang: Optional[str]
+):
+    """Yield SSE events for each transcribed segment, decoding each on the model thread."""
+    start_time = time.time()
+
+    segments = transcriber.transcribe_stream(audio, sample_rate, lang or "auto")
+    parts = []
+    try:
+        while (segment := await _run_model(next, segments, None)) is not None:
+            parts.append(segment.text)
+            event = {
+                "type": "transcript.text.delta",
+                "delta": segment.text,
+                "start": segment.start,
+                "end": segment.end,
+            }
+            yield f"data: {json.dumps(event)}\n\n"
+    finally:
+        # Also on client disconnect: the generator must not be closed mid-step
+        await _run_model(segments.close)
+
+    text = " ".join(part.strip() for part in parts).strip()
+    yield f"data: {json.dumps({'type': 'transcript.text.done', 'text': text})}\n\n"
+
+    logger.success(
+        f"Streaming transcription complete | "
+        f"duration: {len(audio) / sample_rate:.2f}s | "
+        f"processing: {time.time() - start_time:.2f}s | "
+        f"segments: {len(parts)}"
+    )
+
+
+async def _decode_upload(file: UploadFile, header: bytes, max_bytes: int) -> tuple[np.ndarray, int]:
+    """Decode an upload to 16kHz mono float32, raising HTTP 400 if it is not audio."""
+    # wav/flac/ogg: let libsndfile stream straight from the spooled upload
+    if sf is not None and _sniff(header) != "compressed":
+        try:
+            return load_soundfile(file.file)
+        except Exception:
+            await file.seek(0)
+
+    # Everything else (or a failed native decode): read and convert from memory
+    file_bytes = await _read_upload(file, max_bytes)
+    try:
+        return load_audio(file_bytes, file.filename or "audio.wav")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Could not process audio: {e}")
 
 
 @router.get("/models")
@@ -112,56 +278,88 @@ async def transcribe_audio(
     prompt: Optional[str] = Form(default=None),
     response_format: str = Form(default="json"),
     temperature: float = Form(default=0.0),
+    stream: bool = Form(default=False),
 ):
     """
     Transcribe audio to text (OpenAI-compatible endpoint).
 
     Supported formats: mp3, mp4, mpeg, mpga, m4a, wav, webm, flac, ogg
+
+    With stream=true the response is a Server-Sent Events stream that emits a
+    transcript.text.delta event per segment and a final transcript.text.done.
     """
     # Import here to avoid circular import
-    from src.main import get_transcriber
+    from src.main import get_long_audio_pool, get_transcriber
 
     transcriber = get_transcriber()
 
     if transcriber is None:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
-    # Read file
-    file_bytes = await file.read()
-    if not file_bytes:
-        raise HTTPException(status_code=400, detail="Empty file")
+    settings = get_settings()
+    max_bytes = settings.max_upload_mb * 1024 * 1024
 
-    # Load and convert audio
-    try:
-        audio, sample_rate = load_audio(file_bytes, file.filename or "audio.wav")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Could not process audio: {e}")
-
-    # Transcribe
-    start_time = time.time()
+    header = await file.read(12)
+    if not header:
+        raise HTTPException(status_code=400, detail="Empty file")
+    await file.seek(0)
+    if _upload_size(file) > max_bytes:
+        raise HTTPException(status_code=413, detail="File too large")
 
     # Normalize language (empty, "auto" -> None for auto-detect)
     lang = language
     if lang and lang.lower() in ("auto", ""):
         lang = None
 
-    # Temporarily override language if specified
-    original_language = transcriber.language
-    transcriber.language = lang
-
-    try:
-        result = transcriber.transcribe(audio, sample_rate)
-    finally:
-        transcriber.language = original_language
-
-    processing_time = time.time() - start_time
-    text_preview = result.text[:50] + "..." if len(result.text) > 50 else result.text
-    logger.success(
-        f"Transcription complete | "
-        f"duration: {result.audio_duration:.2f}s | "
-        f"processing: {processing_time:.2f}s | "
-        f'text: "{text_preview}"'
-    )
+    # Identical audio + model + language: reuse the stored transcript
+    cache_key = None
+    result = None
+    if not stream and not settings.no_transcript_cache:
+        # Hashing a large upload takes a while; keep it (and the disk read) off the loop
+        audio_digest = await asyncio.to_thread(transcript_cache.digest_file, file.file)
+        cache_key = transcript_cache.make_key(audio_digest, transcriber.get_cache_identity(), lang)
+        cached = await asyncio.to_thread(transcript_cache.get, cache_key)
+        if cached is not None:
+            result = TranscriptionResult(**cached)
+            logger.info("Transcript cache hit")
+
+    if result is None:
+        audio, sample_rate = await _decode_upload(file, header, max_bytes)
+
+        if stream:
+            return StreamingResponse(
+                _stream_transcription(transcriber, audio, sample_rate, lang),
+                media_type="text/event-stream",
+            )
+
+        # Transcribe
+        start_time = time.time()
+
+        long_audio_pool = get_long_audio_pool()
+        if (
+            long_audio_pool is not None
+            and len(audio) / sample_rate > settings.long_audio_threshold_s
+        ):
+            result = await transcribe_parallel(long_audio_pool, audio, sample_rate, lang)
+        else:
+            result = await _run_model(transcriber.transcribe, audio, sample_rate, lang or "auto")
+
+        if cache_key is not None:
+            await asyncio.to_thread(
+                transcript_cache.put,
+                cache_key,
+                asdict(result),
+                settings.transcript_cache_max_entries,
+            )
+
+        processing_time = time.time() - start_time
+        text_preview = result.text[:50] + "..." if len(result.text) > 50 else result.text
+        logger.success(
+            f"Transcription complete | "
+            f"duration: {result.audio_duration:.2f}s | "
+            f"processing: {processing_time:.2f}s | "
+            f'text: "{text_preview}"'
+        )
 
     # Format response
     if response_format == "text":
@@ -180,13 +378,13 @@ async def transcribe_audio(
     elif response_format == "srt":
         # Simple SRT format
         duration = result.audio_duration
-        srt = f"1\n00:00:00,000 --> {int(duration // 3600):02d}:{int((duration % 3600) // 60):02d}:{int(duration % 60):02d},{int((duration % 1) * 1000):03d}\n{result.text}\n"
+        srt = f"1\n{_SRT_ZERO} --> {_format_timestamp(duration, ',')}\n{result.text}\n"
         return PlainTextResponse(srt, media_type="text/plain")
 
     elif response_format == "vtt":
         # WebVTT format
         duration = result.audio_duration
-        vtt = f"WEBVTT\n\n00:00:00.000 --> {int(duration // 3600):02d}:{int((duration % 3600) // 60):02d}:{int(duration % 60):02d}.{int((duration % 1) * 1000):03d}\n{result.text}\n"
+        vtt = f"WEBVTT\n\n{_VTT_ZERO} --> {_format_timestamp(duration, '.')}\n{result.text}\n"
         return PlainTextResponse(vtt, media_type="text/vtt")
 
     else:  # json (default)
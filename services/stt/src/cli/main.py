@@ -9,12 +9,8 @@ import sys
 
 from rich.console import Console
 
-from src.services.audio_capture import AudioCapture, list_devices
-from src.services.vad import SpeechState, VoiceActivityDetector
-from src.transcribers.factory import create_transcriber, get_available_models, get_model_sizes
+from src.transcribers.factory import get_available_models, get_model_sizes
 from src.utils.platform_detect import detect_platform
-from src.utils.stats import SessionStats, create_transcription_stats
-from src.utils.ui import Status, TranscriptionUI, print_loading_message
 
 
 def parse_args() -> argparse.Namespace:
@@ -96,6 +92,8 @@ def main() -> int:
 
     # List devices and exit if requested
     if args.list_devices:
+        from src.services.audio_capture import list_devices
+
         console.print("\n[bold]Available audio input devices:[/bold]\n")
         devices = list_devices()
         for dev in devices:
@@ -103,12 +101,20 @@ def main() -> int:
             console.print(f"      Channels: {dev['channels']}, Sample Rate: {dev['sample_rate']}")
         return 0
 
+    # Heavy imports (torch via VAD, the full rich UI stack) only once we actually run
+    from src.services.audio_capture import AudioCapture
+    from src.services.vad import SpeechState, VoiceActivityDetector
+    from src.transcribers.factory import create_transcriber
+    from src.utils.stats import SessionStats, create_transcription_stats
+    from src.utils.ui import Status, TranscriptionUI, print_loading_message
+
     # Initialize components
     console.print("[yellow]Loading Whisper model...[/yellow]")
     transcriber = create_transcriber(
         model_size=args.model,
         language=args.language,
         backend=args.backend,
+        decoding_mode="greedy",  # VAD-segmented live audio: latency over beam search
     )
     console.print(f"[green]Model ready: {args.model}[/green]")
 
@@ -23,7 +23,10 @@ class Settings(BaseSettings):
     host: str = Field(default="0.0.0.0", description="Server host")
     port: int = Field(default=8100, description="Server port")
     reload: bool = Field(default=False, description="Enable hot reload")
-    workers: int = Field(default=1, description="Number of workers")
+    workers: int | None = Field(
+        default=None, description="Number of workers (None: derive from backend and CPU count)"
+    )
+    max_upload_mb: int = Field(default=100, description="Maximum upload size in MB")
 
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
@@ -39,10 +42,39 @@ class Settings(BaseSettings):
         default="auto", description="Transcription backend"
     )
     language: str | None = Field(default=None, description="Language code or None for auto")
+    decoding_mode: Literal["quality", "greedy"] = Field(
+        default="quality", description="faster-whisper decoding: beam search or greedy"
+    )
+    mlx_quantization: Literal["fp16", "int4"] = Field(
+        default="fp16", description="MLX weights: fp16 or the 4-bit quantized variant"
+    )
+    cpu_threads: int = Field(
+        default=0, ge=0, description="faster-whisper threads per model on CPU (0: library default)"
+    )
+    num_workers: int = Field(
+        default=1, ge=1, description="faster-whisper model replicas decoding concurrently"
+    )
 
     # Storage
     models_dir: str | None = Field(default=None, description="Models cache directory")
 
+    # Long audio: split on silence and transcribe chunks in parallel processes
+    long_audio_threshold_s: float = Field(
+        default=300.0, description="Audio longer than this (seconds) is transcribed in parallel"
+    )
+    long_audio_processes: int | None = Field(
+        default=None,
+        description="Worker processes for long audio (None: auto on CPU, 0: disabled)",
+    )
+
+    # Transcript cache (~/.cache/tiflis-stt/transcripts)
+    no_transcript_cache: bool = Field(
+        default=False, description="Disable the on-disk transcript cache"
+    )
+    transcript_cache_max_entries: int = Field(
+        default=1000, ge=1, description="Transcripts kept on disk (least recently used evicted)"
+    )
+
     # HuggingFace
     hf_token: str | None = Field(default=None, alias="HF_TOKEN", description="HuggingFace token")
 
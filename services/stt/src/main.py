@@ -2,6 +2,7 @@
 # Licensed under the FSL-1.1-NC.
 """Main FastAPI application for STT API."""
 
+import os
 import sys
 from contextlib import asynccontextmanager
 
@@ -11,8 +12,9 @@ from loguru import logger
 
 from src.api.routes import router
 from src.config import get_settings
+from src.services.parallel_transcribe import create_pool
 from src.transcribers.factory import create_transcriber
-from src.utils.platform_detect import detect_platform
+from src.utils.platform_detect import Accelerator, detect_platform
 
 # Load settings
 settings = get_settings()
@@ -28,11 +30,17 @@ logger.add(
 # Global transcriber instance
 transcriber = None
 
+# Process pool for long audio (None when disabled)
+long_audio_pool = None
+
+# Upper bound on the automatic long-audio pool size, per uvicorn worker
+MAX_AUTO_LONG_AUDIO_PROCESSES = 4
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan."""
-    global transcriber
+    global transcriber, long_audio_pool
     platform_info = detect_platform()
     logger.info(f"Platform: {platform_info.os.value}/{platform_info.architecture.value}")
     logger.info(f"Accelerator: {platform_info.accelerator.value}")
@@ -43,9 +51,29 @@ async def lifespan(app: FastAPI):
         model_size=settings.model,
         language=settings.language,
         backend=backend,
+        decoding_mode=settings.decoding_mode,
+        mlx_quantization=settings.mlx_quantization,
+        cpu_threads=settings.cpu_threads,
+        num_workers=settings.num_workers,
     )
     logger.success(f"Model loaded: {settings.model} (backend: {transcriber.get_backend_name()})")
+
+    processes = get_long_audio_processes()
+    if processes > 1:
+        long_audio_pool = create_pool(
+            processes, settings.model, backend, settings.decoding_mode, settings.cpu_threads
+        )
+        logger.info(f"Long audio pool: up to {processes} processes (started on first use)")
+    else:
+        logger.info(
+            f"Parallel long audio transcription disabled ({processes} processes; "
+            "needs 2+, set STT_LONG_AUDIO_PROCESSES to enable)"
+        )
+
     yield
+    if long_audio_pool is not None:
+        long_audio_pool.shutdown(wait=False, cancel_futures=True)
+        long_audio_pool = None
     transcriber = None
     logger.info("Server shutting down...")
 
@@ -99,6 +127,49 @@ def get_transcriber():
     return transcriber
 
 
+def get_long_audio_pool():
+    """Get the long audio process pool (None when disabled)."""
+    return long_audio_pool
+
+
+def get_long_audio_processes() -> int:
+    """
+    Get the number of processes used to split up long transcriptions.
+
+    Only CPU faster-whisper benefits. Every uvicorn worker owns a separate pool
+    whose processes each load a model running ~4 threads, so the default splits the
+    host's cores between the workers (one process per 4 cores of a worker's share)
+    and is capped at MAX_AUTO_LONG_AUDIO_PROCESSES. With the default one worker per
+    4 cores that leaves no room for a pool, and the feature stays off; it turns on
+    automatically for few workers on a large host.
+    """
+    if settings.long_audio_processes is not None:
+        return settings.long_audio_processes
+
+    if settings.backend == "mlx" or detect_platform().accelerator != Accelerator.CPU:
+        return 0
+    processes = (os.cpu_count() or 1) // (4 * get_worker_count())
+    return min(processes, MAX_AUTO_LONG_AUDIO_PROCESSES)
+
+
+def get_worker_count() -> int:
+    """
+    Get the number of uvicorn worker processes.
+
+    Each worker loads its own model, so only CPU faster-whisper scales out by
+    default (about 1 GB RSS per worker, one worker per 4 cores). MLX and CUDA
+    share a single accelerator and stay at one worker.
+    """
+    if settings.workers is not None:
+        return settings.workers
+
+    if settings.backend == "mlx":
+        return 1
+    if detect_platform().accelerator != Accelerator.CPU:
+        return 1
+    return max(1, (os.cpu_count() or 1) // 4)
+
+
 def main():
     """Run the server."""
     import uvicorn
@@ -108,7 +179,7 @@ def main():
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
-        workers=1 if settings.reload else settings.workers,
+        workers=1 if settings.reload else get_worker_count(),
     )
 
 
@@ -2,23 +2,27 @@
 # Licensed under the FSL-1.1-NC.
 """Services package for STT service."""
 
-from src.services.vad import SpeechState, VoiceActivityDetector
-from src.services.audio_capture import AudioCapture, list_devices, get_default_device
-from src.services.model_manager import (
-    download_model,
-    get_models_dir,
-    is_model_cached,
-    list_cached_models,
-)
+import importlib
 
-__all__ = [
-    "SpeechState",
-    "VoiceActivityDetector",
-    "AudioCapture",
-    "list_devices",
-    "get_default_device",
-    "download_model",
-    "get_models_dir",
-    "is_model_cached",
-    "list_cached_models",
-]
+# Exports are resolved lazily so that importing one service module (e.g. from the
+# API routes) does not drag in torch or sounddevice via the others
+_EXPORTS = {
+    "SpeechState": "src.services.vad",
+    "VoiceActivityDetector": "src.services.vad",
+    "AudioCapture": "src.services.audio_capture",
+    "list_devices": "src.services.audio_capture",
+    "get_default_device": "src.services.audio_capture",
+    "are_models_cached": "src.services.model_manager",
+    "download_model": "src.services.model_manager",
+    "get_models_dir": "src.services.model_manager",
+    "is_model_cached": "src.services.model_manager",
+    "list_cached_models": "src.services.model_manager",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,13 +2,20 @@
 # Licensed under the FSL-1.1-NC.
 """Audio capture from microphone using sounddevice."""
 
-import queue
 import threading
+import time
+from collections import deque
 from typing import Optional
 
 import numpy as np
 import sounddevice as sd
 
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# Device enumeration is a slow PortAudio round-trip; results are reused for a few seconds
+_DEVICES_TTL = 5.0
+_devices_cache: Optional[tuple[float, list[dict]]] = None
+
 
 class AudioCapture:
     """Capture audio from microphone in real-time."""
@@ -19,6 +26,7 @@ class AudioCapture:
         channels: int = 1,
         chunk_duration_ms: int = 32,  # Exactly 32ms = 512 samples at 16kHz for Silero VAD
         device: Optional[int] = None,
+        max_queued_chunks: int = 64,
     ):
         """
         Initialize audio capture.
@@ -28,13 +36,18 @@ class AudioCapture:
             channels: Number of audio channels
             chunk_duration_ms: Duration of each audio chunk in milliseconds (min 32ms for VAD)
             device: Audio input device ID (None for default)
+            max_queued_chunks: Chunks kept while the consumer lags; older ones are dropped
         """
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_size = int(sample_rate * chunk_duration_ms / 1000)
         self.device = device
 
-        self._audio_queue: queue.Queue[np.ndarray] = queue.Queue()
+        # Bounded ring: if the consumer stalls, the oldest chunks are dropped
+        # instead of piling up (64 chunks = ~2s at 32ms per chunk)
+        self._ring: deque[np.ndarray] = deque(maxlen=max_queued_chunks)
+        self._ring_cv = threading.Condition()
+        self._scratch = np.empty(self.chunk_size, dtype=np.float32)
         self._stream: Optional[sd.InputStream] = None
         self._running = False
         self._current_level: float = 0.0
@@ -51,15 +64,23 @@ class AudioCapture:
         if status:
             pass  # Could log status flags here
 
-        # Convert to float32 and flatten
-        audio = indata.flatten().astype(np.float32)
-
-        # Calculate audio level (RMS)
-        rms = np.sqrt(np.mean(audio**2))
+        # Calculate audio level (mean absolute value over the raw int16 samples; abs in
+        # int32, since int16 abs(-32768) overflows back to -32768)
+        level = float(np.abs(indata, dtype=np.int32).mean()) * (10.0 / 32768.0)  # For display
         with self._level_lock:
-            self._current_level = min(1.0, rms * 10)  # Scale for display
+            self._current_level = min(1.0, level)
 
-        self._audio_queue.put(audio)
+        # Convert int16 to normalized mono float32 in the reusable scratch buffer
+        scratch = self._scratch[:frames]
+        if indata.shape[1] == 1:
+            np.multiply(indata[:, 0], _INT16_SCALE, out=scratch)
+        else:
+            np.mean(indata, axis=1, dtype=np.float32, out=scratch)
+            scratch *= _INT16_SCALE
+
+        with self._ring_cv:
+            self._ring.append(scratch.copy())
+            self._ring_cv.notify()
 
     def start(self) -> None:
         """Start audio capture."""
@@ -70,7 +91,7 @@ class AudioCapture:
         self._stream = sd.InputStream(
             samplerate=self.sample_rate,
             channels=self.channels,
-            dtype=np.float32,
+            dtype=np.int16,
             blocksize=self.chunk_size,
             device=self.device,
             callback=self._audio_callback,
@@ -95,10 +116,10 @@ class AudioCapture:
         Returns:
             Audio chunk as numpy array, or None if timeout
         """
-        try:
-            return self._audio_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        with self._ring_cv:
+            if not self._ring:
+                self._ring_cv.wait(timeout)
+            return self._ring.popleft() if self._ring else None
 
     def get_audio_level(self) -> float:
         """Get current audio level (0-1)."""
@@ -119,7 +140,12 @@ class AudioCapture:
 
 
 def list_devices() -> list[dict]:
-    """List available audio input devices."""
+    """List available audio input devices (cached for a few seconds)."""
+    global _devices_cache
+    now = time.monotonic()
+    if _devices_cache is not None and now - _devices_cache[0] < _DEVICES_TTL:
+        return list(_devices_cache[1])
+
     devices = []
     for i, device in enumerate(sd.query_devices()):
         if device["max_input_channels"] > 0:
@@ -131,7 +157,17 @@ def list_devices() -> list[dict]:
                     "sample_rate": device["default_samplerate"],
                 }
             )
-    return devices
+    _devices_cache = (now, devices)
+    return list(devices)
+
+
+def _clear_devices_cache() -> None:
+    """Forget cached devices so the next call re-queries PortAudio."""
+    global _devices_cache
+    _devices_cache = None
+
+
+list_devices.cache_clear = _clear_devices_cache  # type: ignore[attr-defined]
 
 
 def get_default_device() -> Optional[int]:
@@ -0,0 +1,95 @@
+# Copyright (c) 2025 Roman Barinov <rbarinov@gmail.com>
+# Licensed under the FSL-1.1-NC.
+"""Fused int16 decode + mono mix + polyphase resample kernels."""
+
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+
+try:
+    from scipy.signal import firwin, resample_poly
+except ImportError:
+    firwin = resample_poly = None
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+@lru_cache(maxsize=8)
+def resample_taps(up: int, down: int) -> np.ndarray:
+    """Design the polyphase anti-aliasing FIR for an up/down ratio (cached per ratio)."""
+    if firwin is None:
+        raise RuntimeError("Resampling requires scipy. Install with: pip install scipy")
+
+    # Same filter resample_poly designs internally for window=("kaiser", 5.0)
+    max_rate = max(up, down)
+    return firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _i16_mono_resample_kernel(pcm, nchan, taps, up, down, out):
+        """Single pass: int16 -> float32, channel average, polyphase FIR, decimation."""
+        n_in = len(pcm) // nchan
+        n_taps = len(taps)
+        half_len = (n_taps - 1) // 2
+        scale = up / (32768.0 * nchan)
+        for m in prange(len(out)):
+            # Output sample m sits at position t of the zero-stuffed, filtered signal;
+            # only input samples i with 0 <= t - i*up < n_taps contribute
+            t = m * down + half_len
+            i_lo = max(0, -((n_taps - 1 - t) // up))
+            i_hi = min(t // up, n_in - 1)
+            acc = 0.0
+            for i in range(i_lo, i_hi + 1):
+                frame = 0.0
+                for c in range(nchan):
+                    frame += pcm[i * nchan + c]
+                acc += frame * taps[t - i * up]
+            out[m] = acc * scale
+
+
+def decode_i16_mono_resample(pcm: np.ndarray, nchan: int, sr: int) -> np.ndarray:
+    """
+    Convert interleaved int16 PCM at any rate to 16kHz mono float32.
+
+    With numba the conversion, downmix and resampling share one pass over the
+    input; without it the equivalent NumPy/SciPy pipeline is used.
+
+    Args:
+        pcm: Interleaved int16 samples
+        nchan: Number of interleaved channels
+        sr: Sample rate of the input
+
+    Returns:
+        Audio samples as float32 numpy array at 16kHz
+    """
+    g = gcd(sr, 16000)
+    up, down = 16000 // g, sr // g
+    n_in = len(pcm) // nchan
+
+    if up == down:
+        frames = pcm[: n_in * nchan].reshape(n_in, nchan)
+        if nchan == 1:
+            return np.multiply(frames[:, 0], np.float32(1.0 / 32768.0), dtype=np.float32)
+        audio = np.mean(frames, axis=1, dtype=np.float32)
+        audio *= np.float32(1.0 / 32768.0)
+        return audio
+
+    taps = resample_taps(up, down)
+
+    if NUMBA_AVAILABLE:
+        out = np.empty(-(-n_in * up // down), dtype=np.float32)
+        _i16_mono_resample_kernel(pcm, nchan, taps, up, down, out)
+        return out
+
+    frames = pcm[: n_in * nchan].reshape(n_in, nchan)
+    audio = np.mean(frames, axis=1, dtype=np.float32)
+    audio *= np.float32(1.0 / 32768.0)
+    return resample_poly(audio, up, down, window=taps).astype(np.float32, copy=False)
@@ -4,6 +4,9 @@
 
 import os
 import shutil
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +15,33 @@ from loguru import logger
 from src.utils.platform_detect import TranscriberBackend, get_effective_backend
 
 
+# Backend modules are imported on first use and then kept, so hot helpers such as
+# is_model_cached and get_mlx_model_path do not repeat the import machinery per call
+@cache
+def _mlx_backend():
+    """The MLX transcriber module (model repo table and cache helpers)."""
+    from src.transcribers import mlx
+
+    return mlx
+
+
+@cache
+def _faster_backend():
+    """The faster-whisper transcriber module (model name table)."""
+    from src.transcribers import faster
+
+    return faster
+
+
+@cache
+def _whisper_model_class():
+    """faster_whisper.WhisperModel, used to download models."""
+    from faster_whisper import WhisperModel
+
+    return WhisperModel
+
+
+@cache
 def get_models_dir() -> Path:
     """
     Get the models directory from environment or default.
@@ -20,6 +50,8 @@ def get_models_dir() -> Path:
     1. MODELS_DIR environment variable
     2. HF_HOME environment variable
     3. Default: ~/.cache/huggingface/hub
+
+    Resolved once per process; the environment is not expected to change at runtime.
     """
     models_dir = os.environ.get("MODELS_DIR")
     if models_dir:
@@ -32,9 +64,10 @@ def get_models_dir() -> Path:
     return Path.home() / ".cache" / "huggingface" / "hub"
 
 
+@cache
 def get_hf_token() -> Optional[str]:
     """
-    Get HuggingFace token from environment.
+    Get HuggingFace token from environment (resolved once per process).
 
     Checks:
     1. HF_TOKEN environment variable
@@ -52,12 +85,9 @@ def setup_hf_token():
 
 def get_mlx_model_path(model_size: str) -> Path:
     """Get path for MLX model cache."""
-    from src.transcribers.mlx import MLX_MODEL_REPOS
-
-    repo_id = MLX_MODEL_REPOS.get(model_size, model_size)
-    cache_dir = get_models_dir()
-    repo_folder = "models--" + repo_id.replace("/", "--")
-    return cache_dir / repo_folder
+    mlx = _mlx_backend()
+    repo_folder = mlx.MLX_CACHE_FOLDERS.get(model_size) or mlx.get_repo_cache_folder(model_size)
+    return get_models_dir() / repo_folder
 
 
 def get_faster_whisper_model_path(model_size: str) -> Path:
@@ -85,26 +115,95 @@ def is_model_cached(model_size: str, backend: Optional[TranscriberBackend] = Non
         return _is_faster_whisper_model_cached(model_size)
 
 
+def are_models_cached(
+    model_sizes: Iterable[str], backend: Optional[TranscriberBackend] = None
+) -> dict[str, bool]:
+    """
+    Check several models at once.
+
+    The cache directory is listed once and only models whose folder is present
+    get the full per-model check, instead of probing every model path in turn.
+
+    Args:
+        model_sizes: Model sizes to check
+        backend: Backend to check for (None for auto-detect)
+
+    Returns:
+        Dictionary mapping each model size to whether it is cached
+    """
+    if backend is None:
+        backend = get_effective_backend()
+
+    if backend == TranscriberBackend.MLX:
+        return _are_mlx_models_cached(list(model_sizes))
+    else:
+        return _are_faster_whisper_models_cached(list(model_sizes))
+
+
+def _list_dir_names(path: Path) -> set[str]:
+    """Names of the entries in path (empty if it does not exist)."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _are_mlx_models_cached(model_sizes: list[str]) -> dict[str, bool]:
+    """Batch MLX cache check: one listing of the hub cache, then probe present repos."""
+    mlx = _mlx_backend()
+    present = _list_dir_names(mlx.get_cache_dir())
+
+    candidates = {}
+    for model_size in model_sizes:
+        repo_id = mlx.MLX_MODEL_REPOS.get(model_size, model_size)
+        folder = mlx.MLX_CACHE_FOLDERS.get(model_size) or mlx.get_repo_cache_folder(repo_id)
+        if folder in present:
+            candidates[model_size] = repo_id
+
+    def probe(repo_id: str) -> bool:
+        try:
+            return mlx.is_model_cached(repo_id)
+        except Exception:
+            return False
+
+    result = dict.fromkeys(model_sizes, False)
+    if candidates:
+        # Each probe is a few independent stats/listings in the HF cache (possibly
+        # on a network volume); overlap them instead of waiting on each in turn
+        with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+            result.update(zip(candidates, pool.map(probe, candidates.values())))
+    return result
+
+
+def _are_faster_whisper_models_cached(model_sizes: list[str]) -> dict[str, bool]:
+    """Batch faster-whisper cache check: one listing of the models dir."""
+    present = _list_dir_names(get_models_dir() / "faster-whisper")
+    return {
+        model_size: model_size in present and _is_faster_whisper_model_cached(model_size)
+        for model_size in model_sizes
+    }
+
+
 def _is_mlx_model_cached(model_size: str) -> bool:
     """Check if MLX model is cached."""
-    from src.transcribers.mlx import MLX_MODEL_REPOS, is_model_cached as mlx_is_cached
-
-    repo_id = MLX_MODEL_REPOS.get(model_size, model_size)
-    return mlx_is_cached(repo_id)
+    mlx = _mlx_backend()
+    repo_id = mlx.MLX_MODEL_REPOS.get(model_size, model_size)
+    return mlx.is_model_cached(repo_id)
 
 
 def _is_faster_whisper_model_cached(model_size: str) -> bool:
     """Check if faster-whisper model is cached."""
     model_path = get_faster_whisper_model_path(model_size)
 
-    if model_path.exists() and model_path.is_dir():
-        # Check for model files
-        required_files = ["model.bin", "config.json"]
-        for f in required_files:
-            if (model_path / f).exists():
-                return True
+    # One directory listing instead of a stat per required file
+    try:
+        with os.scandir(model_path) as it:
+            names = {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return False
 
-    return False
+    return "model.bin" in names and "config.json" in names
 
 
 def download_model(
@@ -137,9 +236,8 @@ def download_model(
 
 def _download_mlx_model(model_size: str, force: bool) -> Path:
     """Download MLX model."""
-    from src.transcribers.mlx import MLX_MODEL_REPOS, download_model_with_progress
-
-    repo_id = MLX_MODEL_REPOS.get(model_size, model_size)
+    mlx = _mlx_backend()
+    repo_id = mlx.MLX_MODEL_REPOS.get(model_size, model_size)
 
     if force:
         # Remove cached model
@@ -148,17 +246,13 @@ def _download_mlx_model(model_size: str, force: bool) -> Path:
             logger.warning(f"Removing cached model: {cache_path}")
             shutil.rmtree(cache_path)
 
-    path = download_model_with_progress(repo_id)
+    path = mlx.download_model_with_progress(repo_id)
     return Path(path)
 
 
 def _download_faster_whisper_model(model_size: str, force: bool) -> Path:
     """Download faster-whisper model."""
-    from faster_whisper import WhisperModel
-
-    from src.transcribers.faster import FASTER_WHISPER_MODEL_SIZES
-
-    model_name = FASTER_WHISPER_MODEL_SIZES.get(model_size, model_size)
+    model_name = _faster_backend().FASTER_WHISPER_MODEL_SIZES.get(model_size, model_size)
     download_root = get_models_dir() / "faster-whisper"
     download_root.mkdir(parents=True, exist_ok=True)
 
@@ -173,7 +267,7 @@ def _download_faster_whisper_model(model_size: str, force: bool) -> Path:
 
         # Download by initializing the model
         # This is how faster-whisper downloads models
-        _ = WhisperModel(
+        _ = _whisper_model_class()(
             model_name,
             device="cpu",  # Just for download
             compute_type="int8",
@@ -210,37 +304,30 @@ def list_cached_models(backend: Optional[TranscriberBackend] = None) -> dict[str
 
 def _list_cached_mlx_models() -> list[str]:
     """List cached MLX models."""
-    from src.transcribers.mlx import MLX_MODEL_REPOS
-
-    cached = []
-    for model_size, repo_id in MLX_MODEL_REPOS.items():
-        try:
-            from src.transcribers.mlx import is_model_cached
-
-            if is_model_cached(repo_id):
-                cached.append(model_size)
-        except Exception:
-            pass
-
-    return cached
+    cached = _are_mlx_models_cached(list(_mlx_backend().MLX_MODEL_REPOS))
+    return [model_size for model_size, is_cached in cached.items() if is_cached]
 
 
 def _list_cached_faster_whisper_models() -> list[str]:
     """List cached faster-whisper models."""
-    from src.transcribers.faster import FASTER_WHISPER_MODEL_SIZES
-
-    cached = []
     models_dir = get_models_dir() / "faster-whisper"
 
-    if not models_dir.exists():
-        return cached
+    try:
+        mtime_ns = os.stat(models_dir).st_mtime_ns
+    except FileNotFoundError:
+        return []
+
+    # Model folders are direct children, so adding/removing one bumps the mtime
+    return list(_list_faster_whisper_models_in(models_dir, mtime_ns))
+
 
-    for model_size in FASTER_WHISPER_MODEL_SIZES.keys():
-        model_path = models_dir / model_size
-        if model_path.exists() and model_path.is_dir():
-            cached.append(model_size)
+@lru_cache(maxsize=8)
+def _list_faster_whisper_models_in(models_dir: Path, mtime_ns: int) -> tuple[str, ...]:
+    """Scan models_dir for faster-whisper models (memoized per directory mtime)."""
+    with os.scandir(models_dir) as it:
+        present = {entry.name for entry in it if entry.is_dir()}
 
-    return cached
+    return tuple(size for size in _faster_backend().FASTER_WHISPER_MODEL_SIZES if size in present)
 
 
 def get_model_size_bytes(model_size: str, backend: Optional[TranscriberBackend] = None) -> int:
@@ -262,15 +349,29 @@ def get_model_size_bytes(model_size: str, backend: Optional[TranscriberBackend]
     else:
         model_path = get_faster_whisper_model_path(model_size)
 
-    if not model_path.exists():
+    # Not memoized: downloads grow files in nested dirs (blobs/, snapshots/<rev>/),
+    # which no top-level mtime reflects, and this only backs the CLI listing
+    try:
+        return sum(_walk_file_sizes(model_path))
+    except FileNotFoundError:
         return 0
 
-    total_size = 0
-    for f in model_path.rglob("*"):
-        if f.is_file():
-            total_size += f.stat().st_size
 
-    return total_size
+def _walk_file_sizes(path: Path) -> Iterator[int]:
+    """
+    Yield the size of every regular file under path.
+
+    Uses os.scandir so the entry type comes from the directory listing itself
+    and only regular files are stat'ed, once each (DirEntry caches the result).
+    Symlinks are not followed: in the HuggingFace cache, snapshot links point at
+    blobs that are already counted.
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_file_sizes(Path(entry.path))
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.stat(follow_symlinks=False).st_size
 
 
 def print_model_info():
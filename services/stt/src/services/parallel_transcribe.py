@@ -0,0 +1,154 @@
+# Copyright (c) 2025 Roman Barinov <rbarinov@gmail.com>
+# Licensed under the FSL-1.1-NC.
+"""Parallel transcription of long audio across worker processes."""
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+
+from src.transcribers.base import BaseTranscriber, TranscriptionResult
+
+# Per-process transcriber, created once by the pool initializer
+_worker_transcriber: Optional[BaseTranscriber] = None
+
+
+def _init_worker(
+    model_size: str, backend: Optional[str], decoding_mode: str, cpu_threads: int
+) -> None:
+    """Load the model once in each worker process."""
+    global _worker_transcriber
+    from src.transcribers.factory import create_transcriber
+
+    _worker_transcriber = create_transcriber(
+        model_size=model_size,
+        backend=backend,
+        device="cpu",
+        decoding_mode=decoding_mode,
+        cpu_threads=cpu_threads,
+    )
+
+
+def _transcribe_chunk(audio: np.ndarray, language: Optional[str]) -> tuple[str, Optional[str]]:
+    """Transcribe one chunk in a worker process."""
+    result = _worker_transcriber.transcribe(audio, language=language or "auto")
+    return result.text, result.language
+
+
+def create_pool(
+    processes: int,
+    model_size: str,
+    backend: Optional[str],
+    decoding_mode: str = "quality",
+    cpu_threads: int = 0,
+) -> ProcessPoolExecutor:
+    """
+    Create a process pool whose workers each hold their own model.
+
+    Workers are spawned (not forked) so they never inherit the server's threads,
+    and each loads the model once on start.
+
+    Args:
+        processes: Number of worker processes
+        model_size: Model size to load in each worker
+        backend: Backend name, or None for auto-detect
+        decoding_mode: faster-whisper decoding mode ("quality" or "greedy")
+        cpu_threads: CTranslate2 threads per worker model (0 = library default)
+
+    Returns:
+        ProcessPoolExecutor ready for transcribe_parallel
+    """
+    return ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(model_size, backend, decoding_mode, cpu_threads),
+    )
+
+
+def find_chunk_bounds(
+    audio: np.ndarray,
+    sample_rate: int = 16000,
+    chunk_duration_s: float = 60.0,
+    search_window_s: float = 5.0,
+    frame_ms: int = 30,
+) -> list[tuple[int, int]]:
+    """
+    Split audio into roughly chunk_duration_s pieces, cutting at quiet frames.
+
+    Each cut is placed at the lowest-energy frame within search_window_s of the
+    nominal boundary, so words are not split across chunks.
+
+    Args:
+        audio: Audio samples as float32 numpy array
+        sample_rate: Audio sample rate
+        chunk_duration_s: Target chunk duration in seconds
+        search_window_s: How far around each boundary to look for silence
+        frame_ms: Energy frame size in milliseconds
+
+    Returns:
+        List of (start, end) sample offsets covering the whole input
+    """
+    frame = int(sample_rate * frame_ms / 1000)
+    n_frames = len(audio) // frame
+    frames = audio[: n_frames * frame].reshape(n_frames, frame)
+    energy = np.einsum("ij,ij->i", frames, frames)  # per-frame energy without a squared temp
+
+    target = int(chunk_duration_s * 1000 / frame_ms)
+    search = int(search_window_s * 1000 / frame_ms)
+
+    bounds = [0]
+    nominal = target
+    # Stop once the remainder would be shorter than half a chunk; it joins the last one
+    while nominal < n_frames - target // 2:
+        lo = max(bounds[-1] // frame + 1, nominal - search)
+        hi = min(n_frames, nominal + search)
+        cut = lo + int(np.argmin(energy[lo:hi]))
+        bounds.append(cut * frame)
+        nominal = cut + target
+    bounds.append(len(audio))
+
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+async def transcribe_parallel(
+    pool: ProcessPoolExecutor,
+    audio: np.ndarray,
+    sample_rate: int = 16000,
+    language: Optional[str] = None,
+) -> TranscriptionResult:
+    """
+    Transcribe long audio by fanning silence-bounded chunks out to the pool.
+
+    Args:
+        pool: Pool created with create_pool
+        audio: Audio samples as float32 numpy array
+        sample_rate: Audio sample rate
+        language: Language code (None for auto-detect)
+
+    Returns:
+        TranscriptionResult with chunk texts joined in order
+    """
+    start_time = time.time()
+    bounds = find_chunk_bounds(audio, sample_rate)
+    logger.info(f"Parallel transcription | chunks: {len(bounds)}")
+
+    futures = [
+        asyncio.wrap_future(pool.submit(_transcribe_chunk, audio[start:end], language))
+        for start, end in bounds
+    ]
+    results = await asyncio.gather(*futures)
+
+    text = " ".join(chunk_text.strip() for chunk_text, _ in results if chunk_text.strip())
+    detected = next((lang for _, lang in results if lang), None)
+
+    return TranscriptionResult(
+        text=text,
+        audio_duration=len(audio) / sample_rate,
+        transcription_time=time.time() - start_time,
+        language=detected,
+    )
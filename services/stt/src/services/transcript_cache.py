@@ -0,0 +1,114 @@
+# Copyright (c) 2025 Roman Barinov <rbarinov@gmail.com>
+# Licensed under the FSL-1.1-NC.
+"""On-disk cache of transcription results keyed by audio content."""
+
+import contextlib
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from loguru import logger
+
+
+def get_cache_dir() -> Path:
+    """Get the transcript cache directory."""
+    return Path.home() / ".cache" / "tiflis-stt" / "transcripts"
+
+
+def digest_file(fileobj: BinaryIO) -> str:
+    """
+    SHA-256 hex digest of a binary file object in a single pass.
+
+    For a SpooledTemporaryFile (FastAPI's UploadFile.file) the wrapped object is
+    hashed directly: file_digest hashes an in-memory BytesIO through getbuffer()
+    without copying, and a rolled-over disk file through one reusable buffer.
+    OpenSSL's SHA-256 releases the GIL while hashing.
+    """
+    inner = getattr(fileobj, "_file", fileobj)
+    pos = inner.tell()
+    inner.seek(0)
+    try:
+        return hashlib.file_digest(inner, "sha256").hexdigest()
+    finally:
+        inner.seek(pos)
+
+
+def make_key(audio_digest: str, model: str, language: Optional[str]) -> str:
+    """
+    Build a cache key for a transcription.
+
+    Args:
+        audio_digest: SHA-256 hex digest of the uploaded audio bytes
+        model: Identity of the transcriber producing the transcript (resolved
+            model plus decoder settings, see BaseTranscriber.get_cache_identity)
+        language: Requested language code (None for auto-detect)
+
+    Returns:
+        Hex key safe to use as a file name
+    """
+    raw = f"{audio_digest}:{model}:{language or 'auto'}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def get(key: str) -> Optional[dict]:
+    """Load a cached transcription payload, or None on miss."""
+    path = get_cache_dir() / f"{key}.json"
+    try:
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable transcript cache entry {path.name}: {e}")
+        return None
+    # Mark as recently used: eviction drops the least recently used entries
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    return payload
+
+
+def put(key: str, payload: dict, max_entries: int) -> None:
+    """
+    Store a transcription payload, then evict down to max_entries.
+
+    The entry is written atomically, so readers never see partial files.
+
+    Args:
+        key: Key from make_key
+        payload: JSON-serializable transcription result
+        max_entries: Most entries to keep; the least recently used go first
+    """
+    cache_dir = get_cache_dir()
+    path = cache_dir / f"{key}.json"
+    tmp_path = cache_dir / f"{key}.{os.getpid()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write transcript cache entry: {e}")
+        return
+    _evict(cache_dir, max_entries)
+
+
+def _evict(cache_dir: Path, max_entries: int) -> None:
+    """Delete the least recently used entries beyond max_entries."""
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    # Another worker may evict the same entry concurrently
+                    with contextlib.suppress(FileNotFoundError):
+                        entries.append((entry.stat().st_mtime, entry.path))
+        if len(entries) <= max_entries:
+            return
+        entries.sort()
+        for _, entry_path in entries[: len(entries) - max_entries]:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(entry_path)
+    except OSError as e:
+        logger.warning(f"Could not evict transcript cache entries: {e}")
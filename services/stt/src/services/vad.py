@@ -2,13 +2,28 @@
 # Licensed under the FSL-1.1-NC.
 """Voice Activity Detection using Silero VAD."""
 
-from collections import deque
 from enum import Enum
 from typing import Optional
 
 import numpy as np
 import torch
 
+try:
+    from silero_vad import load_silero_vad
+
+    SILERO_PACKAGE_AVAILABLE = True
+except ImportError:
+    SILERO_PACKAGE_AVAILABLE = False
+
+try:
+    import onnxruntime  # noqa: F401
+
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
 
 class SpeechState(Enum):
     """Current speech state."""
@@ -27,6 +42,8 @@ class VoiceActivityDetector:
         min_speech_duration_ms: int = 250,
         min_silence_duration_ms: int = 500,
         pre_buffer_duration_ms: int = 300,
+        speech_buffer_duration_ms: int = 30000,
+        energy_floor: float = 1e-3,
     ):
         """
         Initialize VAD.
@@ -37,50 +54,94 @@ class VoiceActivityDetector:
             min_speech_duration_ms: Minimum speech duration to trigger
             min_silence_duration_ms: Minimum silence to end speech segment
             pre_buffer_duration_ms: Audio to keep before speech detection (captures first words)
+            speech_buffer_duration_ms: Preallocated speech segment capacity (grows if exceeded)
+            energy_floor: RMS below which a chunk heard during silence is treated as
+                silence without running the model (0 disables the gate)
         """
         self.sample_rate = sample_rate
         self.threshold = threshold
         self.min_speech_samples = int(sample_rate * min_speech_duration_ms / 1000)
         self.min_silence_samples = int(sample_rate * min_silence_duration_ms / 1000)
         self.pre_buffer_samples = int(sample_rate * pre_buffer_duration_ms / 1000)
-
-        # Load Silero VAD model
-        self.model, _ = torch.hub.load(
-            repo_or_dir="snakers4/silero-vad",
-            model="silero_vad",
-            force_reload=False,
-            trust_repo=True,
-        )
-        self.model.eval()
+        self.energy_floor = energy_floor
+
+        # Load Silero VAD model: the packaged ONNX export (onnxruntime, CPU) when
+        # available, else the packaged TorchScript graph, else torch.hub
+        if SILERO_PACKAGE_AVAILABLE:
+            self.model = load_silero_vad(onnx=ONNX_AVAILABLE)
+        else:
+            self.model, _ = torch.hub.load(
+                repo_or_dir="snakers4/silero-vad",
+                model="silero_vad",
+                force_reload=False,
+                trust_repo=True,
+            )
+            self.model.eval()
+
+        # Reusable model input: Silero takes fixed 512-sample (16kHz) / 256-sample (8kHz)
+        # frames, so one tensor and its shared-memory NumPy view serve every call
+        self._vad_input = torch.zeros(512 if sample_rate == 16000 else 256, dtype=torch.float32)
+        self._vad_input_np = self._vad_input.numpy()
+        # Conversion buffer for int16 chunks of other lengths (grown on demand)
+        self._scratch = np.empty(0, dtype=np.float32)
 
         # State tracking
         self._state = SpeechState.SILENCE
         self._speech_samples = 0
         self._silence_samples = 0
-        self._audio_buffer: list[np.ndarray] = []
+        # Speech segment: one contiguous buffer with a write cursor
+        self._audio_buffer = np.empty(
+            int(sample_rate * speech_buffer_duration_ms / 1000), dtype=np.float32
+        )
+        self._buffer_pos = 0
 
-        # Pre-buffer: keeps last N ms of audio to capture speech start
-        self._pre_buffer: deque[np.ndarray] = deque()
-        self._pre_buffer_current_samples = 0
+        # Pre-buffer: circular buffer holding the last N ms of audio to capture speech start
+        self._pre_buffer = np.empty(self.pre_buffer_samples, dtype=np.float32)
+        self._pre_head = 0
+        self._pre_filled = 0
 
     def _add_to_pre_buffer(self, chunk: np.ndarray) -> None:
-        """Add chunk to pre-buffer, maintaining max size."""
-        self._pre_buffer.append(chunk)
-        self._pre_buffer_current_samples += len(chunk)
-
-        # Remove old chunks if buffer is too large
-        while self._pre_buffer_current_samples > self.pre_buffer_samples and self._pre_buffer:
-            old_chunk = self._pre_buffer.popleft()
-            self._pre_buffer_current_samples -= len(old_chunk)
-
-    def _get_pre_buffer_audio(self) -> list[np.ndarray]:
-        """Get all audio from pre-buffer."""
-        return list(self._pre_buffer)
+        """Write chunk into the circular pre-buffer, overwriting the oldest samples."""
+        capacity = len(self._pre_buffer)
+        if capacity == 0:
+            return
+        if len(chunk) >= capacity:
+            self._pre_buffer[:] = chunk[-capacity:]
+            self._pre_head = 0
+            self._pre_filled = capacity
+            return
+
+        end = self._pre_head + len(chunk)
+        if end <= capacity:
+            self._pre_buffer[self._pre_head : end] = chunk
+        else:
+            split = capacity - self._pre_head
+            self._pre_buffer[self._pre_head :] = chunk[:split]
+            self._pre_buffer[: end - capacity] = chunk[split:]
+        self._pre_head = end % capacity
+        self._pre_filled = min(self._pre_filled + len(chunk), capacity)
+
+    def _get_pre_buffer_audio(self) -> np.ndarray:
+        """Get pre-buffer audio in chronological order."""
+        if self._pre_filled < len(self._pre_buffer):
+            return self._pre_buffer[: self._pre_filled]
+        head = self._pre_head
+        return np.concatenate((self._pre_buffer[head:], self._pre_buffer[:head]))
+
+    def _append_to_buffer(self, chunk: np.ndarray) -> None:
+        """Append chunk to the speech buffer, doubling its capacity when full."""
+        end = self._buffer_pos + len(chunk)
+        if end > len(self._audio_buffer):
+            grown = np.empty(max(end, 2 * len(self._audio_buffer)), dtype=np.float32)
+            grown[: self._buffer_pos] = self._audio_buffer[: self._buffer_pos]
+            self._audio_buffer = grown
+        self._audio_buffer[self._buffer_pos : end] = chunk
+        self._buffer_pos = end
 
     def _clear_pre_buffer(self) -> None:
         """Clear the pre-buffer."""
-        self._pre_buffer.clear()
-        self._pre_buffer_current_samples = 0
+        self._pre_head = 0
+        self._pre_filled = 0
 
     def reset(self) -> None:
         """Reset VAD state."""
@@ -88,7 +149,7 @@ class VoiceActivityDetector:
         self._state = SpeechState.SILENCE
         self._speech_samples = 0
         self._silence_samples = 0
-        self._audio_buffer = []
+        self._buffer_pos = 0
         self._clear_pre_buffer()
 
     @property
@@ -106,17 +167,46 @@ class VoiceActivityDetector:
         Returns:
             Tuple of (current_state, completed_speech_segment or None)
         """
-        # Ensure correct dtype
-        if audio_chunk.dtype != np.float32:
-            audio_chunk = audio_chunk.astype(np.float32)
-
-        # Normalize if needed
-        if np.abs(audio_chunk).max() > 1.0:
-            audio_chunk = audio_chunk / 32768.0
+        if audio_chunk.dtype == np.int16:
+            # Fused cast + scale into a reused buffer: the model input itself for
+            # standard frames (the buffers below copy out of it)
+            n = len(audio_chunk)
+            if n == len(self._vad_input_np):
+                out = self._vad_input_np
+            else:
+                if len(self._scratch) < n:
+                    self._scratch = np.empty(n, dtype=np.float32)
+                out = self._scratch[:n]
+            np.multiply(audio_chunk, _INT16_SCALE, out=out)
+            audio_chunk = out
+        else:
+            # Ensure correct dtype
+            if audio_chunk.dtype != np.float32:
+                audio_chunk = audio_chunk.astype(np.float32, copy=False)
+
+            # Normalize if needed
+            if audio_chunk.max() > 1.0 or audio_chunk.min() < -1.0:
+                audio_chunk = audio_chunk / 32768.0
+
+        # Energy gate: near-silent chunks during silence cannot start speech, so skip
+        # the model (sum of squares via dot: no squared temporary)
+        if self._state == SpeechState.SILENCE and np.dot(
+            audio_chunk, audio_chunk
+        ) < self.energy_floor**2 * len(audio_chunk):
+            self._add_to_pre_buffer(audio_chunk)
+            self._speech_samples = 0
+            return self._state, None
 
         # Get speech probability
-        audio_tensor = torch.from_numpy(audio_chunk)
-        speech_prob = self.model(audio_tensor, self.sample_rate).item()
+        if audio_chunk is self._vad_input_np:
+            audio_tensor = self._vad_input
+        elif len(audio_chunk) == len(self._vad_input_np):
+            np.copyto(self._vad_input_np, audio_chunk)
+            audio_tensor = self._vad_input
+        else:
+            audio_tensor = torch.from_numpy(audio_chunk)
+        with torch.inference_mode():
+            speech_prob = self.model(audio_tensor, self.sample_rate).item()
 
         is_speech = speech_prob >= self.threshold
         completed_segment = None
@@ -130,7 +220,8 @@ class VoiceActivityDetector:
 
                 if self._speech_samples >= self.min_speech_samples:
                     # Speech confirmed! Include pre-buffer to capture first words
-                    self._audio_buffer = self._get_pre_buffer_audio()
+                    self._buffer_pos = 0
+                    self._append_to_buffer(self._get_pre_buffer_audio())
                     self._clear_pre_buffer()
                     self._state = SpeechState.SPEAKING
                     self._silence_samples = 0
@@ -139,18 +230,18 @@ class VoiceActivityDetector:
                 self._speech_samples = 0
 
         elif self._state == SpeechState.SPEAKING:
-            self._audio_buffer.append(audio_chunk)
+            self._append_to_buffer(audio_chunk)
 
             if not is_speech:
                 self._silence_samples += len(audio_chunk)
 
                 if self._silence_samples >= self.min_silence_samples:
                     # End of speech segment
-                    completed_segment = np.concatenate(self._audio_buffer)
+                    completed_segment = self._audio_buffer[: self._buffer_pos].copy()
                     self._state = SpeechState.SILENCE
                     self._speech_samples = 0
                     self._silence_samples = 0
-                    self._audio_buffer = []
+                    self._buffer_pos = 0
                     self.model.reset_states()
             else:
                 self._silence_samples = 0
@@ -159,5 +250,4 @@ class VoiceActivityDetector:
 
     def get_buffered_duration(self) -> float:
         """Get duration of buffered audio in seconds."""
-        total_samples = sum(len(chunk) for chunk in self._audio_buffer)
-        return total_samples / self.sample_rate
+        return self._buffer_pos / self.sample_rate
@@ -2,12 +2,13 @@
 # Licensed under the FSL-1.1-NC.
 """Transcribers package for STT service."""
 
-from src.transcribers.base import BaseTranscriber, TranscriptionResult
+from src.transcribers.base import BaseTranscriber, TranscriptionResult, TranscriptionSegment
 from src.transcribers.factory import create_transcriber, get_available_models, get_model_sizes
 
 __all__ = [
     "BaseTranscriber",
     "TranscriptionResult",
+    "TranscriptionSegment",
     "create_transcriber",
     "get_available_models",
     "get_model_sizes",
@@ -3,11 +3,14 @@
 """Base transcriber interface for STT service."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Optional
 
 import numpy as np
 
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
 
 @dataclass
 class TranscriptionResult:
@@ -20,6 +23,15 @@ class TranscriptionResult:
     language_probability: Optional[float] = None
 
 
+@dataclass
+class TranscriptionSegment:
+    """A timed piece of a transcription."""
+
+    start: float
+    end: float
+    text: str
+
+
 class BaseTranscriber(ABC):
     """Abstract base class for transcription backends."""
 
@@ -43,6 +55,7 @@ class BaseTranscriber(ABC):
         self,
         audio: np.ndarray,
         sample_rate: int = 16000,
+        language: Optional[str] = None,
     ) -> TranscriptionResult:
         """
         Transcribe audio.
@@ -50,12 +63,39 @@ class BaseTranscriber(ABC):
         Args:
             audio: Audio samples as float32 numpy array
             sample_rate: Audio sample rate (default 16000)
+            language: Language for this call ("auto" to auto-detect; None uses the
+                transcriber's configured language)
 
         Returns:
             TranscriptionResult with text and timing info
         """
         pass
 
+    def transcribe_stream(
+        self,
+        audio: np.ndarray,
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+    ) -> Iterator[TranscriptionSegment]:
+        """
+        Transcribe audio, yielding segments as they are decoded.
+
+        Backends that decode incrementally override this; the default yields the
+        full transcription as a single segment.
+
+        Args:
+            audio: Audio samples as float32 numpy array
+            sample_rate: Audio sample rate (default 16000)
+            language: Language for this call ("auto" to auto-detect; None uses the
+                transcriber's configured language)
+
+        Yields:
+            TranscriptionSegment for each decoded piece of speech
+        """
+        result = self.transcribe(audio, sample_rate, language)
+        if result.text:
+            yield TranscriptionSegment(start=0.0, end=result.audio_duration, text=result.text)
+
     @classmethod
     @abstractmethod
     def get_available_models(cls) -> dict[str, str]:
@@ -78,6 +118,18 @@ class BaseTranscriber(ABC):
         """
         pass
 
+    def get_cache_identity(self) -> str:
+        """
+        Get a string identifying everything that shapes this transcriber's output.
+
+        Used in transcript cache keys, so it must change whenever the same audio and
+        language could transcribe differently (other weights, decoder settings).
+
+        Returns:
+            Identity string (e.g., "mlx/<model path>/fp16")
+        """
+        return f"{self.get_backend_name()}/{self.model_size}"
+
     def _normalize_audio(self, audio: np.ndarray) -> np.ndarray:
         """
         Normalize audio to float32 in range [-1, 1].
@@ -88,26 +140,39 @@ class BaseTranscriber(ABC):
         Returns:
             Normalized audio as float32
         """
-        # Ensure correct dtype
-        if audio.dtype != np.float32:
+        # int16 PCM: scale during the conversion; no range probe needed
+        if audio.dtype == np.int16:
+            return np.multiply(audio, _INT16_SCALE, dtype=np.float32)
+
+        # Ensure correct dtype (a converted copy is ours to scale in place)
+        owned = audio.dtype != np.float32
+        if owned:
             audio = audio.astype(np.float32)
 
         # Normalize if needed (int16 range)
-        if np.abs(audio).max() > 1.0:
-            audio = audio / 32768.0
+        if audio.max() > 1.0 or audio.min() < -1.0:
+            if owned:
+                audio *= _INT16_SCALE
+            else:
+                audio = audio * _INT16_SCALE
 
         return audio
 
     def _prepare_language(self, language: Optional[str]) -> Optional[str]:
         """
-        Prepare language parameter.
+        Resolve the language for one call.
+
+        The language is passed per call rather than set on the shared instance, so
+        concurrent requests cannot overwrite each other's (or the server's) setting.
 
         Args:
-            language: Language code or None/"auto"
+            language: Language code, "auto", or None for the configured language
 
         Returns:
             Language code or None for auto-detect
         """
+        if language is None:
+            language = self.language
         if language and language.lower() == "auto":
             return None
         return language
@@ -2,6 +2,7 @@
 # Licensed under the FSL-1.1-NC.
 """Factory for creating transcriber instances based on platform."""
 
+from functools import cache
 from typing import Optional
 
 from loguru import logger
@@ -19,6 +20,10 @@ def create_transcriber(
     language: Optional[str] = None,
     backend: Optional[str] = None,
     device: Optional[str] = None,
+    decoding_mode: str = "quality",
+    mlx_quantization: str = "fp16",
+    cpu_threads: int = 0,
+    num_workers: int = 1,
 ) -> BaseTranscriber:
     """
     Create a transcriber instance based on platform and configuration.
@@ -28,6 +33,11 @@ def create_transcriber(
         language: Language code for transcription (None for auto-detect)
         backend: Force specific backend ("mlx", "faster-whisper", or None for auto)
         device: Force specific device ("cuda", "cpu", "metal", or None for auto)
+        decoding_mode: "quality" (beam search) or "greedy" (low-latency streaming);
+            applies to faster-whisper, MLX always decodes greedily
+        mlx_quantization: MLX weight format, "fp16" or "int4" (4-bit model variant)
+        cpu_threads: faster-whisper CTranslate2 threads per model on CPU (0 = library default)
+        num_workers: faster-whisper model replicas that can decode concurrently
 
     Returns:
         Configured transcriber instance
@@ -55,16 +65,16 @@ def create_transcriber(
     logger.info(f"Backend: {effective_backend.value}")
 
     if effective_backend == TranscriberBackend.MLX:
-        return _create_mlx_transcriber(model_size, language)
+        return _create_mlx_transcriber(model_size, language, mlx_quantization)
     else:
-        return _create_faster_whisper_transcriber(model_size, language, device)
+        return _create_faster_whisper_transcriber(
+            model_size, language, device, decoding_mode, cpu_threads, num_workers
+        )
 
 
-def _create_mlx_transcriber(
-    model_size: str,
-    language: Optional[str],
-) -> BaseTranscriber:
-    """Create MLX transcriber (Apple Silicon only)."""
+@cache
+def _mlx_transcriber_class() -> type[BaseTranscriber]:
+    """Resolve MLXTranscriber once; later calls reuse the class."""
     try:
         from src.transcribers.mlx import MLXTranscriber
     except ImportError as e:
@@ -73,9 +83,33 @@ def _create_mlx_transcriber(
             "Install with: pip install mlx-whisper"
         ) from e
 
-    return MLXTranscriber(
+    return MLXTranscriber
+
+
+@cache
+def _faster_whisper_transcriber_class() -> type[BaseTranscriber]:
+    """Resolve FasterWhisperTranscriber once; later calls reuse the class."""
+    try:
+        from src.transcribers.faster import FasterWhisperTranscriber
+    except ImportError as e:
+        raise RuntimeError(
+            "Faster-whisper backend requires faster-whisper package. "
+            "Install with: pip install faster-whisper"
+        ) from e
+
+    return FasterWhisperTranscriber
+
+
+def _create_mlx_transcriber(
+    model_size: str,
+    language: Optional[str],
+    quantization: str,
+) -> BaseTranscriber:
+    """Create MLX transcriber (Apple Silicon only)."""
+    return _mlx_transcriber_class()(
         model_size=model_size,
         language=language,
+        quantization=quantization,
     )
 
 
@@ -83,20 +117,18 @@ def _create_faster_whisper_transcriber(
     model_size: str,
     language: Optional[str],
     device: Optional[str],
+    decoding_mode: str,
+    cpu_threads: int,
+    num_workers: int,
 ) -> BaseTranscriber:
     """Create faster-whisper transcriber (CUDA/CPU)."""
-    try:
-        from src.transcribers.faster import FasterWhisperTranscriber
-    except ImportError as e:
-        raise RuntimeError(
-            "Faster-whisper backend requires faster-whisper package. "
-            "Install with: pip install faster-whisper"
-        ) from e
-
-    return FasterWhisperTranscriber(
+    return _faster_whisper_transcriber_class()(
         model_size=model_size,
         language=language,
         device=device or "auto",
+        decoding_mode=decoding_mode,
+        cpu_threads=cpu_threads,
+        num_workers=num_workers,
     )
 
 
@@ -112,25 +144,17 @@ def get_available_models(backend: Optional[str] = None) -> dict[str, str]:
     """
     if backend:
         if backend.lower() == "mlx":
-            from src.transcribers.mlx import MLXTranscriber
-
-            return MLXTranscriber.get_available_models()
+            return _mlx_transcriber_class().get_available_models()
         else:
-            from src.transcribers.faster import FasterWhisperTranscriber
-
-            return FasterWhisperTranscriber.get_available_models()
+            return _faster_whisper_transcriber_class().get_available_models()
 
     # Auto-detect backend
     effective_backend = get_effective_backend()
 
     if effective_backend == TranscriberBackend.MLX:
-        from src.transcribers.mlx import MLXTranscriber
-
-        return MLXTranscriber.get_available_models()
+        return _mlx_transcriber_class().get_available_models()
     else:
-        from src.transcribers.faster import FasterWhisperTranscriber
-
-        return FasterWhisperTranscriber.get_available_models()
+        return _faster_whisper_transcriber_class().get_available_models()
 
 
 def get_model_sizes() -> list[str]:
@@ -2,16 +2,21 @@
 # Licensed under the FSL-1.1-NC.
 """Whisper transcription using mlx-whisper (Apple Silicon GPU)."""
 
+import threading
 import time
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 import numpy as np
 from loguru import logger
 
-from src.transcribers.base import BaseTranscriber, TranscriptionResult
+from src.transcribers.base import BaseTranscriber, TranscriptionResult, TranscriptionSegment
 
 
+# Whisper decodes 30-second windows; clips up to this length reuse the scratch buffer
+SCRATCH_SAMPLES = 30 * 16000
+
 # Model mapping to HuggingFace repos (MLX-optimized)
 MLX_MODEL_REPOS = {
     "large-v3-turbo": "mlx-community/whisper-large-v3-turbo",
@@ -21,40 +26,73 @@ MLX_MODEL_REPOS = {
     "small": "mlx-community/whisper-small-mlx",
     "base": "mlx-community/whisper-base-mlx",
     "tiny": "mlx-community/whisper-tiny-mlx",
+    # 4-bit quantized weights (about 4x less weight traffic per decoder step)
+    "large-v3-4bit": "mlx-community/whisper-large-v3-mlx-4bit",
+    "large-v3-turbo-4bit": "mlx-community/whisper-large-v3-turbo-q4",
+}
+
+# Model sizes that have a quantized variant, per quantization
+MLX_QUANTIZED_MODELS = {
+    "int4": {
+        "large-v3": "large-v3-4bit",
+        "large-v3-turbo": "large-v3-turbo-4bit",
+    },
 }
 
 
+def get_repo_cache_folder(repo_id: str) -> str:
+    """HuggingFace hub cache folder name for a repo (e.g. "models--org--name")."""
+    return "models--" + repo_id.replace("/", "--")
+
+
+# Cache folder names for the known model sizes, computed once
+MLX_CACHE_FOLDERS = {
+    model_size: get_repo_cache_folder(repo_id) for model_size, repo_id in MLX_MODEL_REPOS.items()
+}
+_REPO_CACHE_FOLDERS = {MLX_MODEL_REPOS[size]: folder for size, folder in MLX_CACHE_FOLDERS.items()}
+
+
+def get_cache_dir() -> Path:
+    """Get the HuggingFace hub cache directory MLX models are stored in."""
+    return Path.home() / ".cache" / "huggingface" / "hub"
+
+
 def get_model_cache_path(repo_id: str) -> Path:
     """Get the cache path for a model."""
-    cache_dir = Path.home() / ".cache" / "huggingface" / "hub"
-    repo_folder = "models--" + repo_id.replace("/", "--")
+    cache_dir = get_cache_dir()
+    repo_folder = _REPO_CACHE_FOLDERS.get(repo_id) or get_repo_cache_folder(repo_id)
     return cache_dir / repo_folder
 
 
+def get_cached_snapshot(repo_id: str) -> Optional[Path]:
+    """Get the local snapshot directory of a downloaded model (None if not cached)."""
+    snapshots = get_model_cache_path(repo_id) / "snapshots"
+    try:
+        candidates = list(snapshots.iterdir())
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    # Return the first snapshot that has the model weights file
+    for snapshot in candidates:
+        if (snapshot / "weights.npz").exists():
+            return snapshot
+    return None
+
+
 def is_model_cached(repo_id: str) -> bool:
     """Check if model is already downloaded."""
-    cache_path = get_model_cache_path(repo_id)
-    if not cache_path.exists():
-        return False
-    # Check if snapshots directory has content
-    snapshots = cache_path / "snapshots"
-    if snapshots.exists() and any(snapshots.iterdir()):
-        # Check for model weights file
-        for snapshot in snapshots.iterdir():
-            weights = snapshot / "weights.npz"
-            if weights.exists():
-                return True
-    return False
+    return get_cached_snapshot(repo_id) is not None
 
 
 def download_model_with_progress(repo_id: str) -> str:
     """Download model with native HuggingFace progress bar."""
-    from huggingface_hub import snapshot_download
-
-    # Check if already cached
-    if is_model_cached(repo_id):
+    # Already cached: use the snapshot directly, without snapshot_download
+    # re-walking and re-verifying the cache
+    snapshot = get_cached_snapshot(repo_id)
+    if snapshot is not None:
         logger.info(f"Model cached: {repo_id}")
-        return snapshot_download(repo_id, local_files_only=True)
+        return str(snapshot)
+
+    from huggingface_hub import snapshot_download
 
     logger.info(f"Downloading model: {repo_id}")
 
@@ -72,6 +110,8 @@ class MLXTranscriber(BaseTranscriber):
         self,
         model_size: str = "large-v3",
         language: Optional[str] = None,
+        warmup: bool = True,
+        quantization: Literal["fp16", "int4"] = "fp16",
     ):
         """
         Initialize the MLX transcriber.
@@ -79,10 +119,30 @@ class MLXTranscriber(BaseTranscriber):
         Args:
             model_size: Whisper model size (e.g., "large-v3", "medium", "small")
             language: Language code for transcription (None for auto-detect)
+            warmup: Run one silent transcription so the weights are loaded and the
+                Metal kernels compiled before the first real utterance
+            quantization: Weight format; "int4" switches to the 4-bit variant of the
+                model when one exists (falls back to fp16 weights otherwise)
         """
         super().__init__(model_size=model_size, language=language)
         self.device = "metal"  # Always Metal GPU on Apple Silicon
 
+        # Checked before any download, with the same error the factory reports
+        try:
+            import mlx_whisper
+        except ImportError as e:
+            raise RuntimeError(
+                "MLX backend requires mlx-whisper package. Install with: pip install mlx-whisper"
+            ) from e
+        self._mlx = mlx_whisper
+
+        if quantization != "fp16":
+            quantized_size = MLX_QUANTIZED_MODELS.get(quantization, {}).get(model_size)
+            if quantized_size:
+                model_size = quantized_size
+            else:
+                logger.warning(f"No {quantization} variant of {model_size}, using fp16 weights")
+
         # Get model repo
         if model_size in MLX_MODEL_REPOS:
             self.model_repo = MLX_MODEL_REPOS[model_size]
@@ -90,14 +150,30 @@ class MLXTranscriber(BaseTranscriber):
             # Assume it's a direct HuggingFace repo
             self.model_repo = model_size
 
-        # Download model with progress
-        download_model_with_progress(self.model_repo)
+        # Download model with progress; the local snapshot path is what gets passed
+        # to mlx_whisper, so it loads from disk instead of resolving the repo per call
+        self.model_path = download_model_with_progress(self.model_repo)
         self._model_loaded = True
 
+        # Per-thread scratch for compacting strided input (the API runs every call on
+        # one model thread, but the instance may still be used from other threads)
+        self._local = threading.local()
+
+        if warmup:
+            logger.info("Warming up MLX model")
+            self._mlx.transcribe(
+                np.zeros(16000, dtype=np.float32),
+                path_or_hf_repo=self.model_path,
+                language=self._prepare_language(self.language),
+                fp16=True,
+                verbose=False,
+            )
+
     def transcribe(
         self,
         audio: np.ndarray,
         sample_rate: int = 16000,
+        language: Optional[str] = None,
     ) -> TranscriptionResult:
         """
         Transcribe audio using Metal GPU.
@@ -105,26 +181,25 @@ class MLXTranscriber(BaseTranscriber):
         Args:
             audio: Audio samples as float32 numpy array
             sample_rate: Audio sample rate
+            language: Language for this call (None uses the configured language)
 
         Returns:
             TranscriptionResult with text and timing info
         """
-        import mlx_whisper
-
         audio_duration = len(audio) / sample_rate
 
         # Normalize audio
-        audio = self._normalize_audio(audio)
+        audio = self._contiguous(self._normalize_audio(audio))
 
         start_time = time.time()
 
         # Prepare language (None or "auto" means auto-detect)
-        lang = self._prepare_language(self.language)
+        lang = self._prepare_language(language)
 
         # MLX Whisper transcription
-        result = mlx_whisper.transcribe(
+        result = self._mlx.transcribe(
             audio,
-            path_or_hf_repo=self.model_repo,
+            path_or_hf_repo=self.model_path,
             language=lang,
             fp16=True,  # Use float16 for speed
             verbose=False,
@@ -134,22 +209,74 @@ class MLXTranscriber(BaseTranscriber):
 
         # Extract text from result
         text = result.get("text", "").strip()
-        language = result.get("language")
+        detected_language = result.get("language")
 
         return TranscriptionResult(
             text=text,
             audio_duration=audio_duration,
             transcription_time=transcription_time,
-            language=language,
+            language=detected_language,
             language_probability=None,  # MLX doesn't provide this
         )
 
+    def _contiguous(self, audio: np.ndarray) -> np.ndarray:
+        """Return audio as C-contiguous, copying strided views into a reused buffer."""
+        if audio.flags.c_contiguous or len(audio) > SCRATCH_SAMPLES:
+            return audio
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = np.empty(SCRATCH_SAMPLES, dtype=np.float32)
+        out = scratch[: len(audio)]
+        np.copyto(out, audio)
+        return out
+
+    def transcribe_stream(
+        self,
+        audio: np.ndarray,
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+    ) -> Iterator[TranscriptionSegment]:
+        """
+        Transcribe audio and yield its segments.
+
+        mlx-whisper decodes the whole input in one call, so segments are only
+        available once it returns; they are still emitted individually.
+
+        Args:
+            audio: Audio samples as float32 numpy array
+            sample_rate: Audio sample rate
+            language: Language for this call (None uses the configured language)
+
+        Yields:
+            TranscriptionSegment for each decoded segment
+        """
+        audio = self._contiguous(self._normalize_audio(audio))
+        lang = self._prepare_language(language)
+
+        result = self._mlx.transcribe(
+            audio,
+            path_or_hf_repo=self.model_path,
+            language=lang,
+            fp16=True,  # Use float16 for speed
+            verbose=False,
+        )
+        for segment in result.get("segments", []):
+            yield TranscriptionSegment(
+                start=segment["start"], end=segment["end"], text=segment["text"]
+            )
+
+    def get_cache_identity(self) -> str:
+        """Identify the resolved model snapshot (quantized variants are separate repos)."""
+        return f"{self.get_backend_name()}/{self.model_path}/fp16"
+
     @classmethod
     def get_available_models(cls) -> dict[str, str]:
         """Get dictionary of available MLX model sizes."""
         return {
             "large-v3-turbo": "Fastest large model (1.5 GB)",
             "large-v3": "Best quality (3 GB) - Recommended",
+            "large-v3-4bit": "Best quality, 4-bit quantized (~1 GB)",
+            "large-v3-turbo-4bit": "Fastest large model, 4-bit quantized (~0.5 GB)",
             "large-v2": "Previous best (3 GB)",
             "medium": "Balanced (1.5 GB)",
             "small": "Fast (500 MB)",
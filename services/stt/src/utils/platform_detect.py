@@ -5,11 +5,14 @@ Platform detection module for STT service.
 Detects OS, architecture, and available hardware accelerators.
 """
 
+import ctypes
 import os
 import platform
 import subprocess
+import sys
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 
@@ -37,6 +40,10 @@ class TranscriberBackend(Enum):
     FASTER_WHISPER = "faster-whisper"  # CUDA or CPU
 
 
+# One uname() syscall at import; the platform.* helpers layer fallbacks on top of it
+_UNAME = os.uname() if hasattr(os, "uname") else None
+
+
 @dataclass
 class PlatformInfo:
     """Information about the current platform."""
@@ -49,9 +56,10 @@ class PlatformInfo:
     gpu_name: Optional[str] = None
 
 
+@lru_cache(maxsize=1)
 def detect_os() -> OperatingSystem:
     """Detect the current operating system."""
-    system = platform.system().lower()
+    system = (_UNAME.sysname if _UNAME else platform.system()).lower()
     if system == "linux":
         return OperatingSystem.LINUX
     elif system == "darwin":
@@ -61,9 +69,10 @@ def detect_os() -> OperatingSystem:
     return OperatingSystem.UNKNOWN
 
 
+@lru_cache(maxsize=1)
 def detect_architecture() -> Architecture:
     """Detect CPU architecture."""
-    machine = platform.machine().lower()
+    machine = (_UNAME.machine if _UNAME else platform.machine()).lower()
     if machine in ("x86_64", "amd64"):
         return Architecture.X86_64
     elif machine in ("arm64", "aarch64"):
@@ -71,11 +80,13 @@ def detect_architecture() -> Architecture:
     return Architecture.UNKNOWN
 
 
+@lru_cache(maxsize=1)
 def is_apple_silicon() -> bool:
     """Check if running on Apple Silicon (M1/M2/M3+)."""
     return detect_os() == OperatingSystem.DARWIN and detect_architecture() == Architecture.ARM64
 
 
+@lru_cache(maxsize=1)
 def detect_cuda() -> tuple[bool, Optional[str], Optional[str]]:
     """
     Detect if CUDA is available.
@@ -85,6 +96,10 @@ def detect_cuda() -> tuple[bool, Optional[str], Optional[str]]:
     if os.environ.get("CUDA_VISIBLE_DEVICES") == "-1":
         return False, None, None
 
+    # No NVIDIA GPUs on Apple Silicon: skip the nvidia-smi and driver probes
+    if is_apple_silicon():
+        return False, None, None
+
     # Try to detect CUDA via nvidia-smi
     try:
         result = subprocess.run(
@@ -96,40 +111,66 @@ def detect_cuda() -> tuple[bool, Optional[str], Optional[str]]:
         if result.returncode == 0 and result.stdout.strip():
             lines = result.stdout.strip().split("\n")
             if lines:
+                # "<name>, <driver_version>" for the first GPU
                 parts = lines[0].split(", ")
                 gpu_name = parts[0] if parts else None
-
-                # Get CUDA version
-                cuda_result = subprocess.run(
-                    ["nvidia-smi", "--query-gpu=driver_version", "--format=csv,noheader"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                cuda_version = (
-                    cuda_result.stdout.strip().split("\n")[0]
-                    if cuda_result.returncode == 0
-                    else None
-                )
+                cuda_version = parts[1].strip() if len(parts) > 1 else None
 
                 return True, cuda_version, gpu_name
     except (FileNotFoundError, subprocess.TimeoutExpired, Exception):
         pass
 
-    # Try to detect via PyTorch
+    # Fall back to the CUDA driver library itself (what nvidia-smi and torch
+    # both sit on), which avoids importing torch just to ask whether a GPU exists
     try:
-        import torch
-
-        if torch.cuda.is_available():
-            cuda_version = torch.version.cuda
-            gpu_name = torch.cuda.get_device_name(0) if torch.cuda.device_count() > 0 else None
-            return True, cuda_version, gpu_name
-    except ImportError:
+        lib = ctypes.CDLL("libcuda.so.1" if sys.platform == "linux" else "nvcuda.dll")
+        lib.cuInit.restype = ctypes.c_int
+        lib.cuDeviceGetCount.restype = ctypes.c_int
+        count = ctypes.c_int(0)
+        if (
+            lib.cuInit(0) == 0
+            and lib.cuDeviceGetCount(ctypes.byref(count)) == 0
+            and count.value > 0
+        ):
+            return True, None, None
+    except (OSError, AttributeError):
         pass
 
     return False, None, None
 
 
+def _cpu_brand() -> Optional[str]:
+    """
+    CPU model name, read without spawning a process.
+
+    platform.processor() shells out (sysctl on macOS, uname -p on Linux) just to
+    produce this label; read the same information in-process instead.
+    """
+    try:
+        if sys.platform == "darwin":
+            import ctypes.util
+
+            libc = ctypes.CDLL(ctypes.util.find_library("c"))
+            buf = ctypes.create_string_buffer(128)
+            size = ctypes.c_size_t(ctypes.sizeof(buf))
+            status = libc.sysctlbyname(
+                b"machdep.cpu.brand_string", buf, ctypes.byref(size), None, 0
+            )
+            if status == 0:
+                return buf.value.decode() or None
+            return None
+        if sys.platform == "linux":
+            with open("/proc/cpuinfo", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    if line.startswith("model name"):
+                        return line.partition(":")[2].strip() or None
+            return None
+    except (OSError, AttributeError):
+        return None
+    return platform.processor() or None
+
+
+@lru_cache(maxsize=1)
 def detect_accelerator() -> tuple[Accelerator, Optional[str], Optional[str]]:
     """
     Detect the best available hardware accelerator.
@@ -145,7 +186,7 @@ def detect_accelerator() -> tuple[Accelerator, Optional[str], Optional[str]]:
         return Accelerator.CUDA, cuda_version, gpu_name
 
     # Fall back to CPU
-    cpu_info = platform.processor() or "Unknown CPU"
+    cpu_info = _cpu_brand() or "Unknown CPU"
     return Accelerator.CPU, None, cpu_info
 
 
@@ -158,10 +199,14 @@ def get_optimal_backend(accelerator: Accelerator) -> TranscriberBackend:
         return TranscriberBackend.FASTER_WHISPER
 
 
+@lru_cache(maxsize=1)
 def detect_platform() -> PlatformInfo:
     """
     Detect full platform information.
     Returns a PlatformInfo dataclass with all detected information.
+
+    The host does not change while the process runs, so detection (including the
+    nvidia-smi subprocess and CUDA driver probe) runs once and the result is shared.
     """
     os_type = detect_os()
     arch = detect_architecture()
@@ -2,6 +2,7 @@
 # Licensed under the FSL-1.1-NC.
 """Performance statistics tracking for STT application."""
 
+import threading
 import time
 from dataclasses import dataclass, field
 from typing import Optional
@@ -9,7 +10,7 @@ from typing import Optional
 import psutil
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionStats:
     """Statistics for a single transcription."""
 
@@ -17,16 +18,14 @@ class TranscriptionStats:
     transcription_time: float  # seconds
     text: str
     word_count: int
+    # Real-Time Factor: transcription_time / audio_duration (computed once)
+    rtf: float = field(init=False)
 
-    @property
-    def rtf(self) -> float:
-        """Real-Time Factor: transcription_time / audio_duration."""
-        if self.audio_duration > 0:
-            return self.transcription_time / self.audio_duration
-        return 0.0
+    def __post_init__(self) -> None:
+        self.rtf = self.transcription_time / self.audio_duration if self.audio_duration > 0 else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStats:
     """Aggregate statistics for the entire session."""
 
@@ -36,6 +35,9 @@ class SessionStats:
     transcription_count: int = 0
     session_start: float = field(default_factory=time.time)
     last_transcription: Optional[TranscriptionStats] = None
+    # Derived rates, kept up to date by add_transcription (the UI reads them at 10 Hz)
+    average_rtf: float = field(default=0.0, init=False)  # across all transcriptions
+    words_per_minute: float = field(default=0.0, init=False)  # based on audio duration
 
     def add_transcription(self, stats: TranscriptionStats) -> None:
         """Add a transcription's stats to the session totals."""
@@ -45,19 +47,9 @@ class SessionStats:
         self.transcription_count += 1
         self.last_transcription = stats
 
-    @property
-    def average_rtf(self) -> float:
-        """Average Real-Time Factor across all transcriptions."""
-        if self.total_audio_duration > 0:
-            return self.total_transcription_time / self.total_audio_duration
-        return 0.0
-
-    @property
-    def words_per_minute(self) -> float:
-        """Words per minute based on audio duration."""
         if self.total_audio_duration > 0:
-            return (self.total_words / self.total_audio_duration) * 60
-        return 0.0
+            self.average_rtf = self.total_transcription_time / self.total_audio_duration
+            self.words_per_minute = (self.total_words / self.total_audio_duration) * 60
 
     @property
     def session_duration(self) -> float:
@@ -65,32 +57,68 @@ class SessionStats:
         return time.time() - self.session_start
 
 
+# How often the background sampler reads CPU/memory usage (seconds)
+SAMPLE_INTERVAL = 1.0
+
+
 class SystemMonitor:
-    """Monitor system resource usage."""
+    """
+    Monitor system resource usage.
+
+    A daemon thread samples the counters once per interval; the getters return the
+    latest sample, so callers on the UI path make no syscalls.
+    """
 
-    def __init__(self):
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
         self._process = psutil.Process()
+        self._interval = interval
+        # Prime the CPU counters: the first cpu_percent() call only sets the baseline
+        self._process.cpu_percent()
+        psutil.cpu_percent()
+
+        self._cpu = 0.0
+        self._sys_cpu = 0.0
+        self._mem_gb = self._process.memory_info().rss / (1024**3)
+        self._sys_mem_pct = psutil.virtual_memory().percent
+
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._sampler, name="system-monitor", daemon=True)
+        self._thread.start()
+
+    def _sampler(self) -> None:
+        """Refresh the cached readings until stop() is called."""
+        while not self._stopped.wait(self._interval):
+            self._cpu = self._process.cpu_percent()
+            self._mem_gb = self._process.memory_info().rss / (1024**3)
+            self._sys_cpu = psutil.cpu_percent()
+            self._sys_mem_pct = psutil.virtual_memory().percent
+
+    def stop(self) -> None:
+        """Stop the background sampler and wait for it to exit."""
+        self._stopped.set()
+        self._thread.join()
 
     def get_cpu_percent(self) -> float:
         """Get current CPU usage percentage."""
-        return self._process.cpu_percent()
+        return self._cpu
 
     def get_memory_gb(self) -> float:
         """Get current memory usage in GB."""
-        return self._process.memory_info().rss / (1024**3)
+        return self._mem_gb
 
     def get_system_cpu_percent(self) -> float:
         """Get system-wide CPU usage."""
-        return psutil.cpu_percent()
+        return self._sys_cpu
 
     def get_system_memory_percent(self) -> float:
         """Get system-wide memory usage percentage."""
-        return psutil.virtual_memory().percent
+        return self._sys_mem_pct
 
 
 def count_words(text: str) -> int:
     """Count words in text."""
-    return len(text.split()) if text.strip() else 0
+    # str.split() already yields [] for blank text, so no strip() pre-pass is needed
+    return len(text.split())
 
 
 def create_transcription_stats(
@@ -48,27 +48,46 @@ class TranscriptionUI:
 
         self._status = Status.INITIALIZING
         self._audio_level = 0.0
-        self._transcriptions: deque[str] = deque(maxlen=max_history)
+        # Each line is rendered once when added; the panel just groups them
+        self._transcription_lines: deque[Text] = deque(maxlen=max_history)
         self._stats: Optional[SessionStats] = None
         self._system_monitor = SystemMonitor()
+        # CPU/memory readings last drawn in the stats panel
+        self._shown_system = (0.0, 0.0)
         self._live: Optional[Live] = None
 
+        # One layout for the whole session; refresh() only rebuilds panels marked dirty
+        self._layout = self._create_layout()
+        self._dirty = {"status", "transcription", "stats"}
+
     def set_status(self, status: Status) -> None:
         """Set current status."""
-        self._status = status
+        if status != self._status:
+            self._status = status
+            self._dirty.add("status")
 
     def set_audio_level(self, level: float) -> None:
         """Set audio level (0-1)."""
-        self._audio_level = max(0.0, min(1.0, level))
+        level = max(0.0, min(1.0, level))
+        # Only redraw when the displayed percentage changes
+        if int(level * 100) != int(self._audio_level * 100):
+            self._dirty.add("status")
+        self._audio_level = level
 
     def add_transcription(self, text: str) -> None:
         """Add a transcription to history."""
-        if text.strip():
-            self._transcriptions.append(text.strip())
+        text = text.strip()
+        if text:
+            line = Text()
+            line.append("> ", style="green bold")
+            line.append(text)
+            self._transcription_lines.append(line)
+            self._dirty.add("transcription")
 
     def set_stats(self, stats: SessionStats) -> None:
         """Set session statistics."""
         self._stats = stats
+        self._dirty.add("stats")
 
     def _build_status_panel(self) -> Panel:
         """Build the status panel."""
@@ -95,16 +114,10 @@ class TranscriptionUI:
 
     def _build_transcription_panel(self) -> Panel:
         """Build the transcription history panel."""
-        if not self._transcriptions:
+        if not self._transcription_lines:
             content = Text("(waiting for speech...)", style="dim italic")
         else:
-            lines = []
-            for text in self._transcriptions:
-                line = Text()
-                line.append("> ", style="green bold")
-                line.append(text)
-                lines.append(line)
-            content = Group(*lines)
+            content = Group(*self._transcription_lines)
 
         return Panel(content, title="Transcription", border_style="green")
 
@@ -133,15 +146,18 @@ class TranscriptionUI:
 
         # System stats
         table.add_row("", "")  # Separator
-        cpu = self._system_monitor.get_cpu_percent()
-        mem = self._system_monitor.get_memory_gb()
+        cpu, mem = self._shown_system = self._system_snapshot()
         table.add_row("CPU Usage", f"{cpu:.0f}%")
         table.add_row("Memory", f"{mem:.2f} GB")
 
         return Panel(table, title="Statistics", border_style="yellow")
 
-    def build_layout(self) -> Layout:
-        """Build the full UI layout."""
+    def _system_snapshot(self) -> tuple[float, float]:
+        """Latest (CPU %, memory GB) from the monitor's background sampler."""
+        return self._system_monitor.get_cpu_percent(), self._system_monitor.get_memory_gb()
+
+    def _create_layout(self) -> Layout:
+        """Create the layout skeleton and its static header."""
         layout = Layout()
 
         layout.split_column(
@@ -155,13 +171,24 @@ class TranscriptionUI:
         header = Text("Real-time Speech-to-Text", style="bold magenta", justify="center")
         layout["header"].update(header)
 
-        # Panels
-        layout["status"].update(self._build_status_panel())
-        layout["transcription"].update(self._build_transcription_panel())
-        layout["stats"].update(self._build_stats_panel())
-
         return layout
 
+    def build_layout(self) -> Layout:
+        """Bring the layout up to date, rebuilding only the panels that changed."""
+        # System stats change whenever the monitor takes a new sample
+        if self._system_snapshot() != self._shown_system:
+            self._dirty.add("stats")
+
+        if "status" in self._dirty:
+            self._layout["status"].update(self._build_status_panel())
+        if "transcription" in self._dirty:
+            self._layout["transcription"].update(self._build_transcription_panel())
+        if "stats" in self._dirty:
+            self._layout["stats"].update(self._build_stats_panel())
+        self._dirty.clear()
+
+        return self._layout
+
     def start(self) -> Live:
         """Start live display and return the Live context."""
         self._live = Live(
@@ -173,15 +200,17 @@ class TranscriptionUI:
         return self._live
 
     def refresh(self) -> None:
-        """Refresh the display."""
+        """Refresh the display (a no-op when nothing changed)."""
         if self._live:
-            self._live.update(self.build_layout())
+            # Panels are updated in place; Live's auto-refresh renders the same layout
+            self.build_layout()
 
     def stop(self) -> None:
-        """Stop live display."""
+        """Stop live display and the system monitor's sampler."""
         if self._live:
             self._live.stop()
             self._live = None
+        self._system_monitor.stop()
 
 
 def print_loading_message(message: str) -> None:
@@ -0,0 +1,132 @@
+# Copyright (c) 2025 Roman Barinov <rbarinov@gmail.com>
+# Licensed under the FSL-1.1-NC.
+"""Tests for silence-bounded chunking and parallel long audio transcription."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.services import parallel_transcribe
+from src.services.parallel_transcribe import find_chunk_bounds, transcribe_parallel
+from src.transcribers.base import BaseTranscriber, TranscriptionResult
+
+SAMPLE_RATE = 16000
+FRAME = SAMPLE_RATE * 30 // 1000
+
+
+def _noise(seconds: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(int(seconds * SAMPLE_RATE)) * 0.1).astype(np.float32)
+
+
+def test_bounds_cover_input_contiguously():
+    audio = _noise(200.5)
+
+    bounds = find_chunk_bounds(audio, SAMPLE_RATE)
+
+    assert bounds[0][0] == 0
+    assert bounds[-1][1] == len(audio)
+    for (_, end), (start, _) in zip(bounds[:-1], bounds[1:]):
+        assert end == start
+    assert all(start < end for start, end in bounds)
+
+
+def test_short_audio_is_one_chunk():
+    audio = _noise(45.0)
+
+    assert find_chunk_bounds(audio, SAMPLE_RATE) == [(0, len(audio))]
+
+
+def test_split_lands_at_energy_minimum():
+    audio = _noise(120.0)
+    # One silent frame 2 s after the nominal 60 s boundary, inside the search window
+    silent_frame = int(62.0 * 1000 / 30)
+    audio[silent_frame * FRAME : (silent_frame + 1) * FRAME] = 0.0
+
+    bounds = find_chunk_bounds(audio, SAMPLE_RATE)
+
+    assert bounds == [(0, silent_frame * FRAME), (silent_frame * FRAME, len(audio))]
+
+
+def test_silence_outside_search_window_is_ignored():
+    audio = _noise(120.0)
+    silent_frame = int(70.0 * 1000 / 30)
+    audio[silent_frame * FRAME : (silent_frame + 1) * FRAME] = 0.0
+
+    (_, cut), _ = find_chunk_bounds(audio, SAMPLE_RATE)
+
+    assert abs(cut / SAMPLE_RATE - 60.0) <= 5.0
+
+
+class OffsetTranscriber(BaseTranscriber):
+    """Reports where each chunk starts, finishing earlier chunks last."""
+
+    def transcribe(
+        self, audio: np.ndarray, sample_rate: int = 16000, language=None
+    ) -> TranscriptionResult:
+        # The audio encodes its own sample offsets, so the first value is the chunk start
+        start = int(audio[0])
+        time.sleep(0.05 if start == 0 else 0.0)
+        return TranscriptionResult(
+            text=f" {start} ",
+            audio_duration=len(audio) / sample_rate,
+            transcription_time=0.0,
+            language="en" if start else None,
+        )
+
+    @classmethod
+    def get_available_models(cls) -> dict[str, str]:
+        return {}
+
+    @classmethod
+    def get_backend_name(cls) -> str:
+        return "offset"
+
+
+@pytest.fixture
+def offset_pool(monkeypatch):
+    monkeypatch.setattr(parallel_transcribe, "_worker_transcriber", OffsetTranscriber())
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+def test_transcribe_parallel_joins_chunks_in_input_order(offset_pool):
+    audio = np.arange(int(200.0 * SAMPLE_RATE), dtype=np.float32)
+    bounds = find_chunk_bounds(audio, SAMPLE_RATE)
+    assert len(bounds) > 2
+
+    result = asyncio.run(transcribe_parallel(offset_pool, audio, SAMPLE_RATE, language="en"))
+
+    assert result.text == " ".join(str(start) for start, _ in bounds)
+    assert result.audio_duration == pytest.approx(200.0)
+    # First chunk reports no language; the first detected one is used
+    assert result.language == "en"
+
+
+@pytest.mark.parametrize(
+    ("cpus", "workers", "expected"),
+    [
+        (16, 4, 1),  # Default one worker per 4 cores: too few cores left for a pool
+        (16, 1, 4),
+        (64, 2, 4),  # Capped
+        (64, 8, 2),
+    ],
+)
+def test_auto_pool_size_splits_host_between_workers(monkeypatch, cpus, workers, expected):
+    import src.main
+
+    monkeypatch.setattr(src.main.settings, "long_audio_processes", None)
+    monkeypatch.setattr(src.main.settings, "backend", "faster-whisper")
+    monkeypatch.setattr(src.main.settings, "workers", workers)
+    monkeypatch.setattr(src.main.os, "cpu_count", lambda: cpus)
+    monkeypatch.setattr(
+        src.main,
+        "detect_platform",
+        lambda: SimpleNamespace(accelerator=src.main.Accelerator.CPU),
+    )
+
+    assert src.main.get_long_audio_processes() == expected
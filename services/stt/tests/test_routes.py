@@ -0,0 +1,271 @@
+# Copyright (c) 2025 Roman Barinov <rbarinov@gmail.com>
+# Licensed under the FSL-1.1-NC.
+"""Tests for the transcription API routes."""
+
+import io
+import json
+import subprocess
+import threading
+from collections.abc import Iterator
+
+import numpy as np
+import pytest
+import soundfile as sf
+from fastapi.testclient import TestClient
+
+import src.main
+from src.api import routes
+from src.config import get_settings
+from src.services import transcript_cache
+from src.transcribers.base import BaseTranscriber, TranscriptionResult, TranscriptionSegment
+
+SEGMENTS = [
+    TranscriptionSegment(start=0.0, end=0.5, text=" Hello"),
+    TranscriptionSegment(start=0.5, end=1.0, text=" world."),
+]
+RESULT = TranscriptionResult(text="Hello world.", audio_duration=1.0, transcription_time=0.0)
+
+
+class FixedTranscriber(BaseTranscriber):
+    """Returns the same segments for any audio, recording the threads it runs on."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.threads = set()
+
+    def transcribe(
+        self, audio: np.ndarray, sample_rate: int = 16000, language=None
+    ) -> TranscriptionResult:
+        self.threads.add(threading.current_thread().name)
+        return TranscriptionResult(
+            text="Hello world.",
+            audio_duration=len(audio) / sample_rate,
+            transcription_time=0.0,
+            language=self._prepare_language(language),
+        )
+
+    def transcribe_stream(
+        self, audio: np.ndarray, sample_rate: int = 16000, language=None
+    ) -> Iterator[TranscriptionSegment]:
+        for segment in SEGMENTS:
+            self.threads.add(threading.current_thread().name)
+            yield segment
+
+    @classmethod
+    def get_available_models(cls) -> dict[str, str]:
+        return {}
+
+    @classmethod
+    def get_backend_name(cls) -> str:
+        return "fixed"
+
+
+def _wav_bytes(seconds: float = 1.0, sample_rate: int = 16000) -> bytes:
+    buf = io.BytesIO()
+    samples = (np.sin(np.arange(int(seconds * sample_rate)) / 8) * 0.3).astype(np.float32)
+    sf.write(buf, samples, sample_rate, format="WAV", subtype="PCM_16")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def transcriber(monkeypatch):
+    # No lifespan: the fake transcriber stands in for the loaded model
+    fake = FixedTranscriber(model_size="test", language="de")
+    monkeypatch.setattr(src.main, "transcriber", fake)
+    monkeypatch.setattr(src.main, "long_audio_pool", None)
+    monkeypatch.setattr(get_settings(), "no_transcript_cache", True)
+    return fake
+
+
+@pytest.fixture
+def client(transcriber):
+    return TestClient(src.main.app)
+
+
+def _events(body: str) -> list[dict]:
+    assert body.endswith("\n\n")
+    events = []
+    for block in body.split("\n\n")[:-1]:
+        assert block.startswith("data: ")
+        events.append(json.loads(block[len("data: ") :]))
+    return events
+
+
+def test_stream_emits_delta_events_then_done(client):
+    response = client.post(
+        "/v1/audio/transcriptions",
+        files={"file": ("speech.wav", _wav_bytes(), "audio/wav")},
+        data={"stream": "true"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response.text)
+    assert [event["type"] for event in events] == [
+        "transcript.text.delta",
+        "transcript.text.delta",
+        "transcript.text.done",
+    ]
+    assert [(e["delta"], e["start"], e["end"]) for e in events[:2]] == [
+        (" Hello", 0.0, 0.5),
+        (" world.", 0.5, 1.0),
+    ]
+    assert events[-1]["text"] == "Hello world."
+
+
+def test_non_stream_returns_json(client):
+    response = client.post(
+        "/v1/audio/transcriptions",
+        files={"file": ("speech.wav", _wav_bytes(), "audio/wav")},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"text": "Hello world."}
+
+
+def test_request_language_is_per_call(client, transcriber):
+    for stream in ("false", "true"):
+        client.post(
+            "/v1/audio/transcriptions",
+            files={"file": ("speech.wav", _wav_bytes(), "audio/wav")},
+            data={"language": "fr", "stream": stream},
+        )
+
+    response = client.post(
+        "/v1/audio/transcriptions",
+        files={"file": ("speech.wav", _wav_bytes(), "audio/wav")},
+        data={"language": "fr", "response_format": "verbose_json"},
+    )
+
+    assert response.json()["language"] == "fr"
+    # The shared instance's configured language is never touched
+    assert transcriber.language == "de"
+
+
+def test_model_runs_on_one_dedicated_thread(client, transcriber):
+    for stream in ("false", "true"):
+        client.post(
+            "/v1/audio/transcriptions",
+            files={"file": ("speech.wav", _wav_bytes(), "audio/wav")},
+            data={"stream": stream},
+        )
+
+    assert len(transcriber.threads) == 1
+    assert next(iter(transcriber.threads)).startswith("stt-model")
+
+
+def test_cached_transcript_is_keyed_by_model_identity(client, transcriber, monkeypatch, tmp_path):
+    monkeypatch.setattr(get_settings(), "no_transcript_cache", False)
+    monkeypatch.setattr(transcript_cache, "get_cache_dir", lambda: tmp_path)
+    calls = []
+    monkeypatch.setattr(transcriber, "transcribe", lambda *args: calls.append(args) or RESULT)
+
+    def post():
+        return client.post(
+            "/v1/audio/transcriptions",
+            files={"file": ("speech.wav", _wav_bytes(), "audio/wav")},
+        )
+
+    assert post().json() == {"text": "Hello world."}
+    assert post().json() == {"text": "Hello world."}
+    assert len(calls) == 1
+
+    # Same audio through a differently configured model is not served from the cache
+    monkeypatch.setattr(transcriber, "get_cache_identity", lambda: "fixed/other-decoding")
+    post()
+    assert len(calls) == 2
+
+
+def test_upload_over_cap_returns_413(client, monkeypatch):
+    monkeypatch.setattr(get_settings(), "max_upload_mb", 1)
+
+    response = client.post(
+        "/v1/audio/transcriptions",
+        files={"file": ("speech.wav", _wav_bytes(seconds=40.0), "audio/wav")},
+    )
+
+    assert response.status_code == 413
+
+
+def test_empty_upload_returns_400(client):
+    response = client.post(
+        "/v1/audio/transcriptions",
+        files={"file": ("speech.wav", b"", "audio/wav")},
+    )
+
+    assert response.status_code == 400
+
+
+def test_wav_decodes_natively_without_ffmpeg(monkeypatch):
+    def no_ffmpeg(file_bytes):
+        raise AssertionError("ffmpeg should not be used for wav")
+
+    monkeypatch.setattr(routes, "_decode_with_ffmpeg", no_ffmpeg)
+
+    audio, sample_rate = routes.load_audio(_wav_bytes(sample_rate=22050), "speech.wav")
+
+    assert sample_rate == 16000
+    assert audio.dtype == np.float32
+    assert len(audio) == pytest.approx(16000, abs=1)
+
+
+def test_compressed_audio_tries_ffmpeg_before_pydub(monkeypatch):
+    calls = []
+
+    def ffmpeg(file_bytes):
+        calls.append("ffmpeg")
+        return np.zeros(160, dtype=np.float32)
+
+    class NoPydub:
+        @staticmethod
+        def from_file(*args, **kwargs):
+            raise AssertionError("pydub should not be used when ffmpeg succeeds")
+
+    monkeypatch.setattr(routes, "_decode_with_ffmpeg", ffmpeg)
+    monkeypatch.setattr(routes, "AudioSegment", NoPydub)
+
+    audio, sample_rate = routes.load_audio(b"ID3\x03" + bytes(64), "speech.mp3")
+
+    assert calls == ["ffmpeg"]
+    assert (len(audio), sample_rate) == (160, 16000)
+
+
+def test_compressed_audio_falls_back_to_pydub_when_ffmpeg_fails(monkeypatch):
+    calls = []
+
+    def ffmpeg(file_bytes):
+        calls.append("ffmpeg")
+        raise subprocess.CalledProcessError(1, "ffmpeg")
+
+    class FakeSegment:
+        channels = 2
+        frame_rate = 16000
+        raw_data = np.zeros(320, dtype=np.int16).tobytes()
+
+        def set_sample_width(self, width):
+            return self
+
+    class Pydub:
+        @staticmethod
+        def from_file(fileobj, format):
+            calls.append(f"pydub:{format}")
+            return FakeSegment()
+
+    monkeypatch.setattr(routes, "_decode_with_ffmpeg", ffmpeg)
+    monkeypatch.setattr(routes, "AudioSegment", Pydub)
+
+    audio, sample_rate = routes.load_audio(b"ID3\x03" + bytes(64), "speech.mp3")
+
+    assert calls == ["ffmpeg", "pydub:mp3"]
+    assert (len(audio), sample_rate) == (160, 16000)
+
+
+def test_undecodable_audio_raises(monkeypatch):
+    def ffmpeg(file_bytes):
+        raise OSError("ffmpeg not found")
+
+    monkeypatch.setattr(routes, "_decode_with_ffmpeg", ffmpeg)
+    monkeypatch.setattr(routes, "AudioSegment", None)
+
+    with pytest.raises(ValueError):
+        routes.load_audio(b"not audio at all", "speech.mp3")
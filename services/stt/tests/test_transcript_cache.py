@@ -0,0 +1,51 @@
+# Copyright (c) 2025 Roman Barinov <rbarinov@gmail.com>
+# Licensed under the FSL-1.1-NC.
+"""Tests for the on-disk transcript cache."""
+
+import os
+
+import pytest
+
+from src.services import transcript_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(transcript_cache, "get_cache_dir", lambda: tmp_path)
+    return tmp_path
+
+
+def _age(cache_dir, key: str, mtime: float) -> None:
+    os.utime(cache_dir / f"{key}.json", (mtime, mtime))
+
+
+def test_put_then_get_round_trips():
+    transcript_cache.put("a", {"text": "hello"}, max_entries=10)
+
+    assert transcript_cache.get("a") == {"text": "hello"}
+    assert transcript_cache.get("missing") is None
+
+
+def test_put_evicts_least_recently_used(cache_dir):
+    for i, key in enumerate("abc"):
+        transcript_cache.put(key, {"text": key}, max_entries=10)
+        _age(cache_dir, key, 1000 + i)
+    # A hit refreshes "a", so "b" is now the oldest
+    transcript_cache.get("a")
+
+    transcript_cache.put("d", {"text": "d"}, max_entries=3)
+
+    assert sorted(p.stem for p in cache_dir.glob("*.json")) == ["a", "c", "d"]
+
+
+def test_key_depends_on_model_identity_and_language():
+    keys = {
+        transcript_cache.make_key("digest", "faster-whisper/large-v3/int8/beam5", None),
+        transcript_cache.make_key("digest", "faster-whisper/large-v3/int8/greedy", None),
+        transcript_cache.make_key("digest", "faster-whisper/large-v3/int8/beam5", "en"),
+    }
+
+    assert len(keys) == 3
+    assert transcript_cache.make_key("digest", "m", None) == transcript_cache.make_key(
+        "digest", "m", "auto"
+    )
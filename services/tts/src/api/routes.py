@@ -1,8 +1,6 @@
 """FastAPI routes for TTS API."""
 
 import time
-import wave
-from io import BytesIO
 
 from fastapi import APIRouter, HTTPException, Response, status
 from fastapi.responses import StreamingResponse
@@ -14,9 +12,9 @@ from src.schemas import (
     OpenAITTSRequest,
     TTSRequest,
     TTSResponse,
-    VoiceInfo,
     VoicesResponse,
 )
+from src.services.audio_encode import FILE_EXTENSIONS
 from src.services.kokoro_service import get_kokoro_service
 
 router = APIRouter(
@@ -24,18 +22,58 @@ router = APIRouter(
     tags=["tts"],
 )
 
+# The service is a process-wide singleton (constructing it is cheap; the pipeline
+# loads on initialize()), so resolve it once instead of on every request
+_service = get_kokoro_service()
 
-def get_wav_duration(audio_data: bytes) -> float:
-    """Get duration of WAV audio in seconds."""
-    try:
-        with wave.open(BytesIO(audio_data), "rb") as wav_file:
-            frames = wav_file.getnframes()
-            rate = wav_file.getframerate()
-            return frames / float(rate)
-    except Exception:
-        # Fallback: estimate based on file size
-        # WAV: 24kHz, 16-bit, mono = 48000 bytes/second
-        return len(audio_data) / 48000.0
+
+def _text_preview(text: str) -> str:
+    """First 50 characters of the request text, for logging."""
+    return text[:50] + "..." if len(text) > 50 else text
+
+
+def _log_request(voice: str, text: str) -> None:
+    """Log an incoming TTS request (formatted only if INFO is enabled)."""
+    logger.opt(lazy=True, depth=1).info(
+        'TTS Request | voice: {} | text: "{}"', lambda: voice, lambda: _text_preview(text)
+    )
+
+
+def _log_complete(duration: float, processing_time: float, size: int) -> None:
+    """Log a finished synthesis (formatted only if SUCCESS is enabled)."""
+    # Real-time factor (RTF) = processing time / audio duration
+    logger.opt(lazy=True, depth=1).success(
+        "TTS Complete | duration: {:.2f}s | processing: {:.2f}s | RTF: {:.2f}x | size: {:.1f} KB",
+        lambda: duration,
+        lambda: processing_time,
+        lambda: processing_time / duration if duration > 0 else 0,
+        lambda: size / 1024,
+    )
+
+
+def _audio_response(
+    audio_bytes: bytes, content_type: str, duration: float, processing_time: float
+) -> Response:
+    """Return synthesized audio as-is (no re-wrapping) with the metadata headers."""
+    extension = FILE_EXTENSIONS.get(content_type, "wav")
+    return Response(
+        content=audio_bytes,
+        media_type=content_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="speech.{extension}"',
+            "X-Audio-Duration": f"{duration:.3f}",
+            "X-Processing-Time": f"{processing_time:.3f}",
+        },
+    )
+
+
+def _stream_response(chunks) -> StreamingResponse:
+    """Stream WAV chunks as they are synthesized (duration is unknown up front)."""
+    return StreamingResponse(
+        chunks,
+        media_type="audio/wav",
+        headers={"Content-Disposition": 'attachment; filename="speech.wav"'},
+    )
 
 
 @router.post(
@@ -53,7 +91,6 @@ def get_wav_duration(audio_data: bytes) -> float:
 )
 async def create_speech(
     request: OpenAITTSRequest,
-    http_response: Response,
 ) -> Response:
     """
     Create speech from text using Kokoro TTS (OpenAI-compatible endpoint).
@@ -62,44 +99,34 @@ async def create_speech(
     - **input**: The text to generate audio for (max 5000 characters)
     - **voice**: The voice to use (af_heart, af_bella, etc.)
     - **speed**: Speed of the generated audio (0.25 to 4.0)
-    - **response_format**: Format of the output audio (we return wav)
+    - **response_format**: mp3, opus, aac or flac (needs PyAV), otherwise wav
+    - **stream**: Stream WAV audio as each text segment is synthesized
     """
-    service = get_kokoro_service()
     start_time = time.time()
-    text_preview = request.input[:50] + "..." if len(request.input) > 50 else request.input
-
-    logger.info(f'TTS Request | voice: {request.voice} | text: "{text_preview}"')
+    _log_request(request.voice, request.input)
 
     try:
-        audio_io, content_type = await service.synthesize(
+        if request.stream:
+            # Load the pipeline first so setup errors still surface as HTTP errors
+            await _service.initialize()
+            return _stream_response(
+                _service.synthesize_stream(
+                    text=request.input, voice=request.voice, speed=request.speed
+                )
+            )
+
+        audio_io, content_type, duration = await _service.synthesize(
             text=request.input,
             voice=request.voice,
             speed=request.speed,
+            response_format=request.response_format,
         )
 
         audio_bytes = audio_io.getvalue()
         processing_time = time.time() - start_time
-        duration = get_wav_duration(audio_bytes)
-
-        http_response.headers["Content-Disposition"] = 'attachment; filename="speech.wav"'
-        http_response.headers["X-Audio-Duration"] = f"{duration:.3f}"
-        http_response.headers["X-Processing-Time"] = f"{processing_time:.3f}"
-
-        # Real-time factor (RTF) = processing time / audio duration
-        rtf = processing_time / duration if duration > 0 else 0
+        _log_complete(duration, processing_time, len(audio_bytes))
 
-        logger.success(
-            f"TTS Complete | "
-            f"duration: {duration:.2f}s | "
-            f"processing: {processing_time:.2f}s | "
-            f"RTF: {rtf:.2f}x | "
-            f"size: {len(audio_bytes) / 1024:.1f} KB"
-        )
-
-        return StreamingResponse(
-            BytesIO(audio_bytes),
-            media_type=content_type,
-        )
+        return _audio_response(audio_bytes, content_type, duration, processing_time)
 
     except RuntimeError as e:
         logger.error(f"TTS Failed | {e}")
@@ -131,7 +158,6 @@ async def create_speech(
 )
 async def text_to_speech(
     request: TTSRequest,
-    response: Response,
 ) -> Response:
     """
     Convert text to speech using Kokoro TTS.
@@ -139,15 +165,22 @@ async def text_to_speech(
     - **text**: The text to synthesize (max 5000 characters)
     - **voice**: Voice identifier to use (default: "default")
     - **speed**: Speech speed multiplier, 0.25 to 4.0 (default: 1.0)
+    - **stream**: Stream WAV audio as each text segment is synthesized
     """
-    service = get_kokoro_service()
     start_time = time.time()
-    text_preview = request.text[:50] + "..." if len(request.text) > 50 else request.text
-
-    logger.info(f'TTS Request | voice: {request.voice} | text: "{text_preview}"')
+    _log_request(request.voice, request.text)
 
     try:
-        audio_io, content_type = await service.synthesize(
+        if request.stream:
+            # Load the pipeline first so setup errors still surface as HTTP errors
+            await _service.initialize()
+            return _stream_response(
+                _service.synthesize_stream(
+                    text=request.text, voice=request.voice, speed=request.speed
+                )
+            )
+
+        audio_io, content_type, duration = await _service.synthesize(
             text=request.text,
             voice=request.voice,
             speed=request.speed,
@@ -155,27 +188,9 @@ async def text_to_speech(
 
         audio_bytes = audio_io.getvalue()
         processing_time = time.time() - start_time
-        duration = get_wav_duration(audio_bytes)
-
-        # Real-time factor (RTF) = processing time / audio duration
-        rtf = processing_time / duration if duration > 0 else 0
-
-        logger.success(
-            f"TTS Complete | "
-            f"duration: {duration:.2f}s | "
-            f"processing: {processing_time:.2f}s | "
-            f"RTF: {rtf:.2f}x | "
-            f"size: {len(audio_bytes) / 1024:.1f} KB"
-        )
+        _log_complete(duration, processing_time, len(audio_bytes))
 
-        response.headers["Content-Disposition"] = 'attachment; filename="speech.wav"'
-        response.headers["X-Audio-Duration"] = f"{duration:.3f}"
-        response.headers["X-Processing-Time"] = f"{processing_time:.3f}"
-
-        return StreamingResponse(
-            BytesIO(audio_bytes),
-            media_type=content_type,
-        )
+        return _audio_response(audio_bytes, content_type, duration, processing_time)
 
     except RuntimeError as e:
         logger.error(f"TTS Failed | {e}")
@@ -197,17 +212,15 @@ async def text_to_speech(
     summary="List available voices",
     description="Returns a list of all available voice identifiers.",
 )
-async def list_voices() -> VoicesResponse:
+async def list_voices() -> Response:
     """
     Get list of available voices.
 
     Returns a list of voice identifiers with metadata including name, language, and gender.
+    The list is static, so the JSON is serialized once by the service and sent as is
+    (response_model still documents it).
     """
-    service = get_kokoro_service()
-    voices = service.get_available_voices()
-    return VoicesResponse(
-        voices=[VoiceInfo(**v) for v in voices],
-    )
+    return Response(content=_service.get_voices_json(), media_type="application/json")
 
 
 @router.get(
@@ -218,12 +231,11 @@ async def list_voices() -> VoicesResponse:
 async def health_check() -> dict:
     """Health check endpoint with device and configuration info."""
     settings = get_settings()
-    service = get_kokoro_service()
 
     return {
         "status": "ok",
         "service": "kokoro-tts",
-        "device": service.device or "not initialized",
+        "device": _service.device or "not initialized",
         "config": {
             "model": settings.model_repo_id,
             "lang_code": settings.model_lang_code,
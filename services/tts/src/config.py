@@ -2,7 +2,7 @@
 # Licensed under the FSL-1.1-NC.
 """Application configuration using Pydantic Settings."""
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal
 
 from pydantic import Field
@@ -51,13 +51,19 @@ class Settings(BaseSettings):
     device: Literal["auto", "cuda", "mps", "cpu"] = Field(
         default="auto", description="Compute device (auto, cuda, mps, cpu)"
     )
+    precision: Literal["fp32", "fp16", "bf16"] = Field(
+        default="fp32", description="Inference precision on cuda/mps (fp16/bf16 use autocast)"
+    )
+    compile_model: bool = Field(
+        default=False, description="Compile the model with torch.compile (slower startup)"
+    )
 
     # HuggingFace
     hf_token: str | None = Field(default=None, alias="HF_TOKEN", description="HuggingFace token")
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
-        """Parse CORS origins into a list."""
+        """Parse CORS origins into a list (once per Settings instance)."""
         if self.cors_origins == "*":
             return ["*"]
         return [origin.strip() for origin in self.cors_origins.split(",")]
@@ -66,14 +72,19 @@ class Settings(BaseSettings):
         """Determine the compute device to use."""
         if self.device != "auto":
             return self.device
+        return _auto_device()
+
 
-        import torch
+@lru_cache(maxsize=1)
+def _auto_device() -> str:
+    """Pick the best available device (the driver probes run once per process)."""
+    import torch
 
-        if torch.cuda.is_available():
-            return "cuda"
-        elif torch.backends.mps.is_available():
-            return "mps"
-        return "cpu"
+    if torch.cuda.is_available():
+        return "cuda"
+    elif torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
 
 
 @lru_cache
@@ -36,6 +36,7 @@ async def lifespan(app: FastAPI):
     yield
     # Cleanup
     logger.info("Server shutting down...")
+    service.shutdown()
 
 
 app = FastAPI(
@@ -1,41 +1,38 @@
 """Pydantic models for TTS API."""
 
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+# Text to synthesize: stripped and length-checked entirely in pydantic-core
+SpeechText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=5000)]
 
 
 class OpenAITTSRequest(BaseModel):
     """OpenAI-compatible TTS request model."""
 
     model: str = Field(default="tts-1", description="Model name (for compatibility)")
-    input: str = Field(..., min_length=1, max_length=5000, description="Text to convert to speech")
+    input: SpeechText = Field(..., description="Text to convert to speech")
     voice: str = Field(default="af_heart", description="Voice identifier")
     speed: float = Field(default=1.0, ge=0.25, le=4.0, description="Speech speed multiplier")
     response_format: str = Field(default="mp3", description="Audio format (mp3, opus, aac, flac, wav)")
-
-    @field_validator("input")
-    @classmethod
-    def validate_input(cls, v: str) -> str:
-        """Validate and clean input text."""
-        return v.strip()
+    stream: bool = Field(default=False, description="Stream WAV audio as segments are synthesized")
 
 
 class TTSRequest(BaseModel):
     """Request model for text-to-speech conversion."""
 
-    text: str = Field(..., min_length=1, max_length=5000, description="Text to convert to speech")
+    text: SpeechText = Field(..., description="Text to convert to speech")
     voice: str = Field(default="default", description="Voice identifier")
     speed: float = Field(default=1.0, ge=0.25, le=4.0, description="Speech speed multiplier")
-
-    @field_validator("text")
-    @classmethod
-    def validate_text(cls, v: str) -> str:
-        """Validate and clean input text."""
-        return v.strip()
+    stream: bool = Field(default=False, description="Stream WAV audio as segments are synthesized")
 
 
 class TTSResponse(BaseModel):
     """Response model for TTS request."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool = True
     format: str = "wav"
     duration_ms: int | None = None
@@ -44,6 +41,8 @@ class TTSResponse(BaseModel):
 class VoiceInfo(BaseModel):
     """Information about an available voice."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     name: str
     language: str = "en"
@@ -53,11 +52,15 @@ class VoiceInfo(BaseModel):
 class VoicesResponse(BaseModel):
     """Response model for voices list."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     voices: list[VoiceInfo]
 
 
 class ErrorResponse(BaseModel):
     """Error response model."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     error: str
     detail: str | None = None
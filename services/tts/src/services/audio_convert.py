@@ -0,0 +1,56 @@
+# Copyright (c) 2025 Roman Barinov <rbarinov@gmail.com>
+# Licensed under the FSL-1.1-NC.
+"""Fused float32 -> int16 PCM conversion kernel."""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def _f32_to_pcm16_kernel(samples, out):
+        """Single pass: scale, clip, round and cast each sample."""
+        for i in range(samples.shape[0]):
+            v = samples[i] * np.float32(32767.0)
+            if v > 32767.0:
+                v = 32767.0
+            elif v < -32768.0:
+                v = -32768.0
+            out[i] = np.int16(np.rint(v))
+
+
+def f32_to_pcm16(samples: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Convert a float waveform in [-1, 1] to 16-bit PCM.
+
+    With numba the scale, clip, round and cast share one pass over the samples;
+    without it the NumPy equivalent runs in place on a single float32 temporary.
+
+    Args:
+        samples: 1-D float32 samples
+        out: int16 array of the same length to write into
+
+    Returns:
+        out
+    """
+    if NUMBA_AVAILABLE:
+        _f32_to_pcm16_kernel(samples, out)
+        return out
+
+    scaled = np.multiply(samples, 32767.0, dtype=np.float32)
+    np.clip(scaled, -32768.0, 32767.0, out=scaled)
+    np.rint(scaled, out=scaled)
+    np.copyto(out, scaled, casting="unsafe")
+    return out
+
+
+def warmup() -> None:
+    """Compile (or load from the numba cache) the kernel before the first request."""
+    f32_to_pcm16(np.zeros(16, dtype=np.float32), np.empty(16, dtype=np.int16))
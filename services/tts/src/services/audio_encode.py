@@ -0,0 +1,65 @@
+# Copyright (c) 2025 Roman Barinov <rbarinov@gmail.com>
+# Licensed under the FSL-1.1-NC.
+"""Compressed audio encoding (mp3, opus, aac, flac) with PyAV."""
+
+from io import BytesIO
+
+import numpy as np
+
+try:
+    import av
+
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+
+
+# response_format -> (container, codec, content type)
+FORMATS = {
+    "mp3": ("mp3", "libmp3lame", "audio/mpeg"),
+    "opus": ("ogg", "libopus", "audio/ogg"),
+    "aac": ("adts", "aac", "audio/aac"),
+    "flac": ("flac", "flac", "audio/flac"),
+}
+
+# Content type -> file extension for Content-Disposition
+FILE_EXTENSIONS = {
+    "audio/wav": "wav",
+    "audio/mpeg": "mp3",
+    "audio/ogg": "opus",
+    "audio/aac": "aac",
+    "audio/flac": "flac",
+}
+
+
+def can_encode(response_format: str) -> bool:
+    """Whether response_format is a compressed format this process can produce."""
+    return AV_AVAILABLE and response_format in FORMATS
+
+
+def encode_pcm16(pcm: np.ndarray, sample_rate: int, response_format: str) -> tuple[bytes, str]:
+    """
+    Encode mono 16-bit PCM directly into a compressed format.
+
+    Args:
+        pcm: 1-D int16 samples
+        sample_rate: Sample rate of pcm
+        response_format: One of FORMATS
+
+    Returns:
+        A tuple of (encoded_bytes, content_type).
+    """
+    container, codec, content_type = FORMATS[response_format]
+
+    out = BytesIO()
+    with av.open(out, "w", format=container) as output:
+        stream = output.add_stream(codec, rate=sample_rate, layout="mono")
+        frame = av.AudioFrame.from_ndarray(pcm.reshape(1, -1), format="s16", layout="mono")
+        frame.sample_rate = sample_rate
+        # The codec context re-frames and converts the sample format for the encoder
+        for packet in stream.encode(frame):
+            output.mux(packet)
+        for packet in stream.encode(None):
+            output.mux(packet)
+
+    return out.getvalue(), content_type
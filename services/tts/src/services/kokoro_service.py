@@ -1,12 +1,20 @@
 """Kokoro TTS service wrapper."""
 
 import asyncio
+import os
+import re
+import struct
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from io import BytesIO
 
 import numpy as np
 from loguru import logger
 
 try:
+    import torch
     from kokoro import KPipeline
 
     KOKORO_AVAILABLE = True
@@ -14,7 +22,143 @@ except ImportError:
     KOKORO_AVAILABLE = False
 
 from src.config import Settings, get_settings
-from src.schemas import VoiceInfo
+from src.schemas import VoiceInfo, VoicesResponse
+from src.services import audio_convert, audio_encode
+
+# Kokoro output format
+SAMPLE_RATE = 24000
+
+# Pipeline segments: one per input line (KPipeline re.splits on this, compiled once)
+_SPLIT_PATTERN = re.compile(r"\n")
+
+# Canonical 44-byte PCM WAV header (mono, 16-bit):
+# "RIFF" size "WAVE" "fmt " 16 format channels rate byte_rate block_align bits "data" size
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _pack_wav_header(buffer: bytearray, riff_size: int, data_size: int) -> None:
+    """Write the WAV header for mono 16-bit SAMPLE_RATE audio at the start of buffer."""
+    _WAV_HEADER.pack_into(
+        buffer, 0,
+        b"RIFF", riff_size, b"WAVE",
+        b"fmt ", 16, 1, 1, SAMPLE_RATE, SAMPLE_RATE * 2, 2, 16,
+        b"data", data_size,
+    )  # fmt: skip
+
+
+# WAV header for a stream of unknown length: RIFF and data sizes set to 0xFFFFFFFF,
+# which players treat as "read until EOF"
+_STREAM_WAV_HEADER = bytearray(_WAV_HEADER.size)
+_pack_wav_header(_STREAM_WAV_HEADER, 0xFFFFFFFF, 0xFFFFFFFF)
+_STREAM_WAV_HEADER = bytes(_STREAM_WAV_HEADER)
+
+
+def _to_pcm16(audio, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Convert a float waveform tensor to 16-bit PCM.
+
+    The result is written straight into out when given (e.g. a view into the WAV
+    buffer), so no intermediate int16 array or bytes copy is made.
+    """
+    audio = audio.detach()
+    if audio.device.type != "cpu":
+        # Convert on the accelerator (fused kernels) and transfer int16, half the
+        # bytes of float32. Upcast first: autocast output may be fp16/bf16, where
+        # 32767 rounds to 32768 and .short() would wrap it to -32768. Same range as
+        # audio_convert.f32_to_pcm16, so both paths produce identical PCM
+        pcm = audio.float().mul(32767.0).clamp_(-32768.0, 32767.0).round_().short()
+        pcm = pcm.cpu().numpy()
+        if out is None:
+            return pcm
+        np.copyto(out, pcm)
+        return out
+
+    if audio.dtype != torch.float32:
+        # Half-precision output from autocast inference
+        audio = audio.float()
+    samples = audio.numpy()  # zero-copy view of the CPU tensor
+    if out is None:
+        out = np.empty(samples.shape, dtype=np.int16)
+    return audio_convert.f32_to_pcm16(samples, out)
+
+
+def _encode_wav(segments: list) -> BytesIO:
+    """
+    Encode float waveform segments back to back as one WAV file.
+
+    The BytesIO is sized once up front and written in place through its buffer, so
+    the file is neither grown chunk by chunk nor copied into the BytesIO afterwards
+    (BytesIO(bytearray) would copy the whole PCM).
+    """
+    n_samples = sum(audio.shape[-1] for audio in segments)
+    data_size = n_samples * 2
+    out = BytesIO()
+    # Writing the last byte allocates the full size in one go
+    out.seek(_WAV_HEADER.size + data_size - 1)
+    out.write(b"\0")
+
+    with out.getbuffer() as buffer:
+        _pack_wav_header(buffer, 36 + data_size, data_size)
+
+        # Each segment is converted straight into its slice of the buffer (no torch.cat)
+        pcm = np.frombuffer(buffer, dtype=np.int16, offset=_WAV_HEADER.size)
+        offset = 0
+        for audio in segments:
+            length = audio.shape[-1]
+            _to_pcm16(audio, out=pcm[offset : offset + length])
+            offset += length
+        # Drop numpy's export of the buffer so it can be released
+        del pcm
+
+    out.seek(0)
+    return out
+
+
+@contextmanager
+def _inference(autocast: "tuple[str, torch.dtype] | None"):
+    """inference_mode, plus autocast to (device_type, dtype) when given."""
+    with torch.inference_mode():
+        if autocast is None:
+            yield
+        else:
+            device_type, dtype = autocast
+            with torch.autocast(device_type=device_type, dtype=dtype):
+                yield
+
+
+def _synthesize_segments(
+    pipeline: "KPipeline", text: str, voice, speed: float, autocast=None
+) -> list:
+    """Run the pipeline over every segment of text and return their audio tensors."""
+    with _inference(autocast):
+        results = pipeline(text, voice=voice, speed=speed, split_pattern=_SPLIT_PATTERN)
+        return [result.audio for result in results if result.audio is not None]
+
+
+def _next_pcm_chunk(results, autocast=None) -> memoryview | None:
+    """Synthesize the next segment of a pipeline generator as 16-bit PCM (None when exhausted)."""
+    # inference_mode and autocast are per thread, so enter them around each step
+    with _inference(autocast):
+        for result in results:
+            if result.audio is not None:
+                return memoryview(_to_pcm16(result.audio)).cast("B")
+    return None
+
+
+def _configure_cpu_threads() -> None:
+    """
+    Pin torch's CPU thread pools for the single synthesis thread.
+
+    Leaves one core for the event loop and uses one inter-op thread; an explicit
+    OMP_NUM_THREADS from the environment takes precedence.
+    """
+    if "OMP_NUM_THREADS" not in os.environ:
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) - 1))
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only settable before the first inter-op parallel work in the process
+        pass
 
 
 class KokoroService:
@@ -37,7 +181,18 @@ class KokoroService:
         self._settings = settings or get_settings()
         self._pipeline: KPipeline | None = None
         self._voices: dict[str, VoiceInfo] = {}
+        # model_dump() of _voices, built once in _load_voices (the list never changes)
+        self._voices_dump: list[dict] = []
+        # VoicesResponse JSON of _voices, serialized once in _load_voices
+        self._voices_json: bytes = VoicesResponse(voices=[]).model_dump_json().encode()
+        # Voice style tensors, ~0.5 MB each (510x1x256 float32)
+        self._voice_packs: dict[str, "torch.FloatTensor"] = {}
         self._device: str | None = None
+        # (device_type, dtype) for autocast inference, None for fp32
+        self._autocast: tuple[str, "torch.dtype"] | None = None
+        # Synthesis runs on one dedicated thread: concurrent requests queue here instead
+        # of each driving torch's intra-op thread pool at the same time
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kokoro")
 
     @property
     def device(self) -> str | None:
@@ -53,20 +208,91 @@ class KokoroService:
             # Determine device
             self._device = self._settings.get_device()
             logger.info(f"Initializing Kokoro pipeline on device: {self._device}")
+            if self._device == "cpu":
+                _configure_cpu_threads()
+            self._autocast = self._resolve_autocast()
 
             # Load pipeline in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            self._pipeline = await loop.run_in_executor(
-                None,
-                lambda: KPipeline(
-                    lang_code=self._settings.model_lang_code,
-                    repo_id=self._settings.model_repo_id,
-                    device=self._device,
-                ),
+            self._pipeline = await asyncio.to_thread(
+                KPipeline,
+                lang_code=self._settings.model_lang_code,
+                repo_id=self._settings.model_repo_id,
+                device=self._device,
             )
+            if self._settings.compile_model:
+                self._compile_model()
             self._load_voices()
+            await asyncio.to_thread(self._load_voice_packs)
+            audio_convert.warmup()
+            await self._warmup()
             logger.info(f"Kokoro pipeline initialized successfully")
 
+    def _resolve_autocast(self) -> "tuple[str, torch.dtype] | None":
+        """Pick the autocast dtype for the configured precision (accelerators only)."""
+        precision = self._settings.precision
+        if precision == "fp32":
+            return None
+        if self._device not in ("cuda", "mps"):
+            logger.info(f"Precision {precision} ignored on {self._device}, using fp32")
+            return None
+
+        dtype = torch.bfloat16 if precision == "bf16" else torch.float16
+        if (
+            dtype is torch.bfloat16
+            and self._device == "cuda"
+            and not torch.cuda.is_bf16_supported()
+        ):
+            logger.warning("bf16 not supported on this GPU, using fp16")
+            dtype = torch.float16
+        logger.info(f"Inference autocast to {dtype} on {self._device}")
+        return self._device, dtype
+
+    def _compile_model(self) -> None:
+        """
+        Wrap the pipeline's model in torch.compile, keeping eager mode if that fails.
+
+        Compilation itself is lazy: the graphs are built by the warmup synthesis.
+        """
+        try:
+            self._pipeline.model = torch.compile(
+                self._pipeline.model, mode="reduce-overhead", fullgraph=False
+            )
+            logger.info("Kokoro model wrapped with torch.compile")
+        except Exception as e:
+            logger.warning(f"torch.compile unavailable, using eager model: {e}")
+
+    async def _warmup(self) -> None:
+        """
+        Run one short synthesis and discard it.
+
+        The first inference pays one-off costs (CUDA kernel autotuning, cuDNN algorithm
+        search, MPS graph compilation, G2P lookups); paying them at startup keeps them
+        off the first request. Runs on the synthesis thread, like real requests.
+        """
+        voice_id = self._settings.default_voice
+        voice_pack = self._voice_packs.get(voice_id, voice_id)
+        try:
+            await self._run(
+                _synthesize_segments, self._pipeline, "hi.", voice_pack, 1.0, self._autocast
+            )
+        except Exception as e:
+            model = self._pipeline.model
+            if not hasattr(model, "_orig_mod"):
+                logger.warning(f"Kokoro warmup failed, first request will be slower: {e}")
+                return
+            # The compiled graph failed to build for this model/op set: fall back to eager
+            logger.warning(f"torch.compile failed during warmup, using eager model: {e}")
+            self._pipeline.model = model._orig_mod
+            await self._warmup()
+
+    async def _run(self, func, *args):
+        """Run a blocking synthesis call on the service's executor."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def shutdown(self) -> None:
+        """Wait for in-flight synthesis to finish and stop the executor."""
+        self._executor.shutdown(wait=True)
+
     def _load_voices(self) -> None:
         """Load available voices from the model."""
         default_voices = [
@@ -105,19 +331,36 @@ class KokoroService:
             {"id": "am_echo", "name": "Echo (American Male)", "language": "en", "gender": "male"},
         ]
         for voice in default_voices:
-            self._voices[voice["id"]] = VoiceInfo(**voice)
+            # Hardcoded and known valid: skip validation
+            self._voices[voice["id"]] = VoiceInfo.model_construct(**voice)
+        self._voices_dump = [v.model_dump() for v in self._voices.values()]
+        self._voices_json = (
+            VoicesResponse.model_construct(voices=list(self._voices.values()))
+            .model_dump_json()
+            .encode()
+        )
+
+    def _load_voice_packs(self) -> None:
+        """Load every available voice's tensor up front, so no request pays the download/load."""
+        for voice_id in self.AVAILABLE_VOICES:
+            self._voice_packs[voice_id] = self._pipeline.load_voice(voice_id)
 
     async def synthesize(
         self,
         text: str,
         voice: str = "af_heart",
         speed: float = 1.0,
-    ) -> tuple[BytesIO, str]:
+        response_format: str = "wav",
+    ) -> tuple[BytesIO, str, float]:
         """
         Synthesize speech from text.
 
+        Every newline-separated segment is synthesized and the audio is joined into
+        one file, matching what synthesize_stream sends. mp3/opus/aac/flac are
+        encoded straight from the PCM when PyAV is installed; anything else is WAV.
+
         Returns:
-            A tuple of (audio_data, content_type).
+            A tuple of (audio_data, content_type, duration_seconds).
         """
         await self.initialize()
 
@@ -126,46 +369,70 @@ class KokoroService:
 
         # Use default voice from settings if voice not found
         voice_id = voice if voice in self._voices else self._settings.default_voice
+        # Preloaded tensor when there is one (a settings default outside the list loads by id)
+        voice_pack = self._voice_packs.get(voice_id, voice_id)
 
         # Run synthesis in thread pool
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: list(self._pipeline(text, voice=voice_id, speed=speed, split_pattern=r"\n"))[0],
+        segments = await self._run(
+            _synthesize_segments, self._pipeline, text, voice_pack, speed, self._autocast
         )
 
-        # Get audio from result (result is (graphemes, phonemes, audio))
-        import torch
+        wav = _encode_wav(segments)
+        duration = sum(audio.shape[-1] for audio in segments) / SAMPLE_RATE
 
-        audio_data = result.audio  # type: ignore
+        if audio_encode.can_encode(response_format):
+            pcm = np.frombuffer(wav.getbuffer(), dtype=np.int16, offset=_WAV_HEADER.size)
+            encoded, content_type = await self._run(
+                audio_encode.encode_pcm16, pcm, SAMPLE_RATE, response_format
+            )
+            return BytesIO(encoded), content_type, duration
 
-        # Convert to WAV bytes
-        audio_io = BytesIO()
-        import wave
+        return wav, "audio/wav", duration
 
-        with wave.open(audio_io, "wb") as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(24000)  # Kokoro sample rate
-            wav_file.writeframes(
-                (audio_data.numpy() * 32767).astype(np.int16).tobytes()  # type: ignore
-            )
+    async def synthesize_stream(
+        self,
+        text: str,
+        voice: str = "af_heart",
+        speed: float = 1.0,
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize speech and yield a WAV stream as each text segment is ready.
 
-        audio_io.seek(0)
-        return audio_io, "audio/wav"
+        The first chunk is a WAV header with unknown-length sizes; every following
+        chunk is the 16-bit PCM for one pipeline segment (text split on newlines),
+        so the first audio is sent after one segment instead of the whole text.
 
-    def get_available_voices(self) -> list[dict]:
-        """Return list of available voices."""
-        return [v.model_dump() for v in self._voices.values()]
+        Yields:
+            WAV header, then PCM chunks
+        """
+        await self.initialize()
 
+        if self._pipeline is None:
+            raise RuntimeError("Pipeline not initialized")
+
+        voice_id = voice if voice in self._voices else self._settings.default_voice
+        # Preloaded tensor when there is one (a settings default outside the list loads by id)
+        voice_pack = self._voice_packs.get(voice_id, voice_id)
+
+        # KPipeline.__call__ is a generator: nothing runs until the first next()
+        results = self._pipeline(text, voice=voice_pack, speed=speed, split_pattern=_SPLIT_PATTERN)
+
+        yield _STREAM_WAV_HEADER
+        # Each step runs one segment through the model and converts it to PCM off the
+        # event loop, so the loop is free to send the previous chunk meanwhile
+        while (chunk := await self._run(_next_pcm_chunk, results, self._autocast)) is not None:
+            yield chunk
+
+    def get_available_voices(self) -> list[dict]:
+        """Return list of available voices (a shared list; callers must not mutate it)."""
+        return self._voices_dump
 
-# Singleton instance
-_kokoro_service: KokoroService | None = None
+    def get_voices_json(self) -> bytes:
+        """Return the voices list as a serialized VoicesResponse (built once)."""
+        return self._voices_json
 
 
+@lru_cache(maxsize=1)
 def get_kokoro_service() -> KokoroService:
     """Get or create the singleton Kokoro service instance."""
-    global _kokoro_service
-    if _kokoro_service is None:
-        _kokoro_service = KokoroService()
-    return _kokoro_service
+    return KokoroService()
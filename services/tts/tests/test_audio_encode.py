@@ -0,0 +1,66 @@
+# Copyright (c) 2025 Roman Barinov <rbarinov@gmail.com>
+# Licensed under the FSL-1.1-NC.
+"""Tests for compressed audio encoding with PyAV."""
+
+from io import BytesIO
+
+import numpy as np
+import pytest
+
+from src.services import audio_encode
+
+SAMPLE_RATE = 24000
+
+
+def _sine_pcm16(seconds: float = 1.0) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * 440.0 * t) * 0.5 * 32767).astype(np.int16)
+
+
+def _decode(data: bytes) -> tuple[np.ndarray, int]:
+    """Decode to mono samples; returns (samples, sample_rate)."""
+    import av
+
+    with av.open(BytesIO(data)) as container:
+        stream = container.streams.audio[0]
+        frames = [frame.to_ndarray().reshape(-1) for frame in container.decode(stream)]
+        return np.concatenate(frames), stream.rate
+
+
+@pytest.mark.parametrize("response_format", sorted(audio_encode.FORMATS))
+def test_round_trip_preserves_duration(response_format):
+    pytest.importorskip("av")
+    pcm = _sine_pcm16(seconds=1.0)
+
+    data, content_type = audio_encode.encode_pcm16(pcm, SAMPLE_RATE, response_format)
+
+    assert content_type == audio_encode.FORMATS[response_format][2]
+    samples, rate = _decode(data)
+    # Lossy codecs add encoder delay/padding of at most a few frames
+    assert len(samples) / rate == pytest.approx(1.0, abs=0.1)
+
+
+def test_flac_round_trip_is_lossless():
+    pytest.importorskip("av")
+    pcm = _sine_pcm16(seconds=0.5)
+
+    data, _ = audio_encode.encode_pcm16(pcm, SAMPLE_RATE, "flac")
+
+    samples, rate = _decode(data)
+    assert rate == SAMPLE_RATE
+    np.testing.assert_array_equal(samples, pcm)
+
+
+def test_can_encode_known_formats_only_with_pyav(monkeypatch):
+    monkeypatch.setattr(audio_encode, "AV_AVAILABLE", True)
+    assert all(audio_encode.can_encode(fmt) for fmt in audio_encode.FORMATS)
+    assert not audio_encode.can_encode("wav")
+    assert not audio_encode.can_encode("pcm")
+
+    monkeypatch.setattr(audio_encode, "AV_AVAILABLE", False)
+    assert not any(audio_encode.can_encode(fmt) for fmt in audio_encode.FORMATS)
+
+
+def test_every_content_type_has_a_file_extension():
+    content_types = {content_type for _, _, content_type in audio_encode.FORMATS.values()}
+    assert content_types | {"audio/wav"} <= set(audio_encode.FILE_EXTENSIONS)
@@ -0,0 +1,139 @@
+# Copyright (c) 2025 Roman Barinov <rbarinov@gmail.com>
+# Licensed under the FSL-1.1-NC.
+"""Tests for WAV encoding and output format selection in the Kokoro service."""
+
+import asyncio
+import wave
+from io import BytesIO
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api import routes
+from src.services import audio_encode, kokoro_service
+from src.services.kokoro_service import SAMPLE_RATE, KokoroService
+
+
+def test_stream_header_has_unknown_lengths():
+    header = kokoro_service._STREAM_WAV_HEADER
+    fields = kokoro_service._WAV_HEADER.unpack(header)
+
+    assert len(header) == 44
+    assert fields == (
+        b"RIFF", 0xFFFFFFFF, b"WAVE",
+        b"fmt ", 16, 1, 1, SAMPLE_RATE, SAMPLE_RATE * 2, 2, 16,
+        b"data", 0xFFFFFFFF,
+    )  # fmt: skip
+
+
+@pytest.fixture
+def torch():
+    return pytest.importorskip("torch")
+
+
+def _segments(torch, *lengths: int) -> list:
+    rng = np.random.default_rng(0)
+    return [torch.from_numpy(rng.uniform(-1.2, 1.2, n).astype(np.float32)) for n in lengths]
+
+
+def _expected_pcm16(segments: list) -> np.ndarray:
+    samples = np.concatenate([s.numpy() for s in segments]) * 32767.0
+    return np.rint(np.clip(samples, -32768.0, 32767.0)).astype(np.int16)
+
+
+def test_encode_wav_header_and_length(torch):
+    segments = _segments(torch, 2400, 0, 1000)
+
+    wav = kokoro_service._encode_wav(segments)
+
+    assert wav.tell() == 0
+    data = wav.getvalue()
+    assert len(data) == 44 + 2 * 3400
+    with wave.open(BytesIO(data)) as reader:
+        assert (reader.getnchannels(), reader.getsampwidth()) == (1, 2)
+        assert reader.getframerate() == SAMPLE_RATE
+        assert reader.getnframes() == 3400
+        pcm = np.frombuffer(reader.readframes(3400), dtype=np.int16)
+    np.testing.assert_array_equal(pcm, _expected_pcm16(segments))
+
+
+def test_encode_wav_without_audio_is_header_only(torch):
+    data = kokoro_service._encode_wav([]).getvalue()
+
+    with wave.open(BytesIO(data)) as reader:
+        assert reader.getnframes() == 0
+    assert len(data) == 44
+
+
+class FakePipeline:
+    """Yields one fixed segment per input line, like KPipeline's results."""
+
+    def __init__(self, torch):
+        self._audio = _segments(torch, SAMPLE_RATE // 2)[0]
+
+    def __call__(self, text, voice, speed, split_pattern):
+        for _ in split_pattern.split(text):
+            yield SimpleNamespace(audio=self._audio)
+
+
+@pytest.fixture
+def service(torch, monkeypatch):
+    monkeypatch.setattr(kokoro_service, "KOKORO_AVAILABLE", True)
+    monkeypatch.setattr(kokoro_service, "torch", torch, raising=False)
+    svc = KokoroService()
+    svc._pipeline = FakePipeline(torch)
+    svc._load_voices()
+    yield svc
+    svc.shutdown()
+
+
+def _synthesize(service: KokoroService, response_format: str):
+    return asyncio.run(service.synthesize("one\ntwo", response_format=response_format))
+
+
+@pytest.mark.parametrize("response_format", ["wav", "pcm"])
+def test_uncompressed_formats_return_wav(service, response_format):
+    audio_io, content_type, duration = _synthesize(service, response_format)
+
+    assert content_type == "audio/wav"
+    assert duration == pytest.approx(1.0)
+    assert audio_io.getvalue()[:4] == b"RIFF"
+
+
+@pytest.mark.parametrize("response_format", sorted(audio_encode.FORMATS))
+def test_compressed_formats_use_their_content_type(service, response_format):
+    pytest.importorskip("av")
+
+    audio_io, content_type, duration = _synthesize(service, response_format)
+
+    assert content_type == audio_encode.FORMATS[response_format][2]
+    assert duration == pytest.approx(1.0)
+    assert audio_io.getvalue()[:4] != b"RIFF"
+
+
+def test_compressed_format_falls_back_to_wav_without_pyav(service, monkeypatch):
+    monkeypatch.setattr(audio_encode, "AV_AVAILABLE", False)
+
+    audio_io, content_type, _ = _synthesize(service, "mp3")
+
+    assert content_type == "audio/wav"
+    assert audio_io.getvalue()[:4] == b"RIFF"
+
+
+def test_speech_route_names_file_after_content_type(service, monkeypatch):
+    monkeypatch.setattr(audio_encode, "AV_AVAILABLE", False)
+    monkeypatch.setattr(routes, "_service", service)
+    app = FastAPI()
+    app.include_router(routes.router)
+
+    response = TestClient(app).post(
+        "/v1/audio/speech", json={"input": "hello", "response_format": "mp3"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "audio/wav"
+    assert response.headers["content-disposition"] == 'attachment; filename="speech.wav"'
+    assert response.headers["x-audio-duration"] == "0.500"